@@ -24,6 +24,7 @@ from .input_checks import (  # noqa: F401
     tasks_exist,
     charge_mult_exist,
     xyz_exist,
+    scan_inputs,
 )
 
 # Input checks for el agente_v2 (The Standard Trio)
@@ -49,6 +50,7 @@ from .output_TDDFT import (  # noqa: F401
     excitation_energy_exist,
     oscillator_strengths_available,
     check_output_tddft,
+    scan_output_tddft,
 )
 
 # Fukui-specific checks
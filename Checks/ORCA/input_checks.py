@@ -1,5 +1,7 @@
 # Auto_benchmark/Checks/input_checks.py
 from __future__ import annotations
+from dataclasses import dataclass
+from typing import Iterable
 import re
 from Auto_benchmark.config import COMPOSITE_METHODS  # e.g., {"B97-3C", "R2SCAN-3C", ...}
 
@@ -9,13 +11,38 @@ __all__ = [
     "tasks_exist",
     "charge_mult_exist",
     "xyz_exist",
+    "InputFacts",
+    "scan_input",
+    "scan_inputs",
 ]
 
+# ---------------- Patterns ----------------
+
+METHOD_LINE_RE = re.compile(r"^\s*!", re.M)
+
+_BASIS_REGEXES = [
+    r"sto-\d+g(?:\*\*|\*|)",                   # STO-3G, STO-6G
+    r"\d+-\d+g(?:\([\w,+\-]*\))?(?:\*\*|\*|)", # 6-31G(d), 6-311G**, 6-31+G(d,p)
+    r"def2-\w+",                               # def2-SVP, def2-TZVP, ...
+    r"(?:aug-)?cc-pV\w+",                      # cc-pVDZ/VTZ, aug-cc-pVTZ
+    r"def-\w+",                                # def-SVP/TZVP (older)
+    r"zora-def2-\w+",                          # ZORA-def2-SVP, ...
+]
+BASIS_RE = re.compile(r"(?:^|\s)(" + "|".join(_BASIS_REGEXES) + r")(?:\s|$)", re.I)
+BASIS_BLOCK_RE = re.compile(r"^\s*%basis\b", re.I | re.M)
+
+# Matched against the upper-cased input; word boundaries avoid partial matches (e.g., "OPTION")
+TASK_KEYWORDS = ("OPT", "FREQ", "SP", "MD", "CIS", "TDDFT")
+TASKS_RE = re.compile(r"\b(?:" + "|".join(TASK_KEYWORDS) + r")\b")
+
+INT_RE = re.compile(r"[+-]?\d+")
+XYZFILE_RE = re.compile(r"xyzfile", re.I)
+
 # ---------------- Input checks ----------------
 
 def method_exist(text: str) -> bool:
     """True if there is a method/task line starting with '!'."""
-    return bool(re.search(r"^\s*!", text, re.M))
+    return bool(METHOD_LINE_RE.search(text))
 
 
 def basis_exist(text: str) -> bool:
@@ -28,25 +55,19 @@ def basis_exist(text: str) -> bool:
       • the '!' line contains a composite method in COMPOSITE_METHODS (e.g., B97-3c)
         which implies a built-in basis in ORCA.
     """
-    basis_regexes = [
-        r"sto-\d+g(?:\*\*|\*|)",                   # STO-3G, STO-6G
-        r"\d+-\d+g(?:\([\w,+\-]*\))?(?:\*\*|\*|)", # 6-31G(d), 6-311G**, 6-31+G(d,p)
-        r"def2-\w+",                               # def2-SVP, def2-TZVP, ...
-        r"(?:aug-)?cc-pV\w+",                      # cc-pVDZ/VTZ, aug-cc-pVTZ
-        r"def-\w+",                                # def-SVP/TZVP (older)
-        r"zora-def2-\w+",                          # ZORA-def2-SVP, ...
-    ]
-    basis_re = re.compile(r"(?:^|\s)(" + "|".join(basis_regexes) + r")(?:\s|$)", re.I)
-
     # Find the first '!' line (method/task line)
     excl_line = next((l.strip() for l in text.splitlines() if l.strip().startswith("!")), "")
+    return _basis_from(text, excl_line)
+
 
+def _basis_from(text: str, excl_line: str) -> bool:
+    """basis_exist() given the already-located first '!' line."""
     # 1) explicit basis on '!' line
-    if excl_line and basis_re.search(excl_line):
+    if excl_line and BASIS_RE.search(excl_line):
         return True
 
     # 2) %basis block anywhere
-    if re.search(r"^\s*%basis\b", text, flags=re.I | re.M):
+    if BASIS_BLOCK_RE.search(text):
         return True
 
     # 3) composite 3c method implies a (built-in) basis
@@ -64,17 +85,8 @@ def tasks_exist(text: str) -> bool:
     Return True if any known ORCA task keyword appears anywhere in the input.
     Detects tasks on '!' lines, in %blocks, or anywhere else in the text.
     """
-    task_keywords = {"OPT", "FREQ", "SP", "MD", "CIS", "TDDFT"}
-
     # Convert entire input to uppercase once for uniform search
-    text_upper = text.upper()
-
-    # Use regex word boundaries to avoid partial matches (e.g., "OPTION")
-    for kw in task_keywords:
-        if re.search(rf"\b{kw}\b", text_upper):
-            return True
-
-    return False
+    return bool(TASKS_RE.search(text.upper()))
 
 
 def charge_mult_exist(txt: str) -> bool:
@@ -82,7 +94,12 @@ def charge_mult_exist(txt: str) -> bool:
     True if a geometry spec line ('* ...') contains charge and multiplicity.
     Supports both inline geometry and '* xyzfile <charge> <mult> <file>'.
     """
-    for line in txt.splitlines():
+    return _charge_mult_from(txt.splitlines())
+
+
+def _charge_mult_from(lines: Iterable[str]) -> bool:
+    """charge_mult_exist() over already-split lines."""
+    for line in lines:
         stripped = line.strip()
         if not stripped.startswith("*"):
             continue
@@ -92,11 +109,56 @@ def charge_mult_exist(txt: str) -> bool:
         charge_idx = 2 if parts[1].lower() == "xyzfile" else 1
         if len(parts) > charge_idx + 1:
             ch, mult = parts[charge_idx], parts[charge_idx + 1]
-            if re.fullmatch(r"[+-]?\d+", ch) and re.fullmatch(r"[+-]?\d+", mult):
+            if INT_RE.fullmatch(ch) and INT_RE.fullmatch(mult):
                 return True
     return False
 
 
 def xyz_exist(text: str) -> bool:
     """True if the input references an external XYZ file via 'xyzfile'."""
-    return bool(re.search(r"xyzfile", text, re.I))
+    return bool(XYZFILE_RE.search(text))
+
+
+# ---------------- Combined scan ----------------
+
+@dataclass(frozen=True, slots=True)
+class InputFacts:
+    """The five input booleans for one input (or, via scan_inputs, for all of a folder's inputs)."""
+    method: bool = False
+    basis: bool = False
+    tasks: bool = False
+    charge_mult: bool = False
+    xyz: bool = False
+
+
+def scan_input(text: str) -> InputFacts:
+    """
+    Evaluate all five input checks on one input text, splitting it into
+    lines once (shared by the '!'-line and geometry-line checks).
+    """
+    lines = text.splitlines()
+    excl_line = next((l.strip() for l in lines if l.strip().startswith("!")), "")
+    return InputFacts(
+        method=bool(METHOD_LINE_RE.search(text)),
+        basis=_basis_from(text, excl_line),
+        tasks=bool(TASKS_RE.search(text.upper())),
+        charge_mult=_charge_mult_from(lines),
+        xyz=bool(XYZFILE_RE.search(text)),
+    )
+
+
+def scan_inputs(texts: Iterable[str]) -> InputFacts:
+    """
+    Per-check `all()` over a folder's inputs, scanning each text once.
+    No inputs → every check is False.
+    """
+    facts = [scan_input(t) for t in texts]
+    if not facts:
+        return InputFacts()
+    return InputFacts(
+        method=all(f.method for f in facts),
+        basis=all(f.basis for f in facts),
+        tasks=all(f.tasks for f in facts),
+        charge_mult=all(f.charge_mult for f in facts),
+        xyz=all(f.xyz for f in facts),
+    )
@@ -3,6 +3,11 @@ import re
 from pathlib import Path
 from typing import Optional, Union, List
 
+KEYWORD_LINE_RE = re.compile(r"^!\s*(.+)", re.MULTILINE)
+XYZFILE_REF_RE = re.compile(r"\*\s*xyzfile\s+[-+]?\d+\s+[-+]?\d+\s+(['\"]?)([^\"'\s]+)\1", re.IGNORECASE)
+INLINE_XYZ_RE = re.compile(r"\*\s*xyz\s+[-+]?\d+\s+[-+]?\d+\s+([\s\S]+?)\*", re.IGNORECASE)
+INTERNAL_COORDS_RE = re.compile(r"\*\s*int\s+[-+]?\d+\s+[-+]?\d+\s+([\s\S]+?)\*", re.IGNORECASE)
+
 def check_input_exists(filepath: Optional[Path]) -> bool:
     """
     Simple check if the input file exists.
@@ -32,7 +37,7 @@ def check_orca_task(input_text: str, task_to_check: Union[str, List[str]]) -> bo
     else:
         target_keywords = {t.lower() for t in task_to_check}
     
-    keyword_lines = re.findall(r"^!\s*(.+)", input_text, re.MULTILINE)
+    keyword_lines = KEYWORD_LINE_RE.findall(input_text)
     
     for line in keyword_lines:
         lower_line = line.lower()
@@ -63,7 +68,7 @@ def verify_structure(input_text: str, folder_path: Path) -> str:
     # 1. Check for External File Reference
     # Pattern: * xyzfile charge mult filename
     # Example: * xyzfile 0 1 benzene.xyz
-    file_match = re.search(r"\*\s*xyzfile\s+[-+]?\d+\s+[-+]?\d+\s+(['\"]?)([^\"'\s]+)\1", input_text, re.IGNORECASE)
+    file_match = XYZFILE_REF_RE.search(input_text)
     
     if file_match:
         filename = file_match.group(2)
@@ -80,7 +85,7 @@ def verify_structure(input_text: str, folder_path: Path) -> str:
     # 2. Check for Inline Coordinates
     # Pattern: * xyz charge mult ... [coordinates] ... *
     # We look for the opening block and ensure it's not empty
-    inline_match = re.search(r"\*\s*xyz\s+[-+]?\d+\s+[-+]?\d+\s+([\s\S]+?)\*", input_text, re.IGNORECASE)
+    inline_match = INLINE_XYZ_RE.search(input_text)
     
     if inline_match:
         content = inline_match.group(1).strip()
@@ -89,7 +94,7 @@ def verify_structure(input_text: str, folder_path: Path) -> str:
             return "yes"
             
     # 3. Check for Internal Coordinates (rare but possible: * int)
-    int_match = re.search(r"\*\s*int\s+[-+]?\d+\s+[-+]?\d+\s+([\s\S]+?)\*", input_text, re.IGNORECASE)
+    int_match = INTERNAL_COORDS_RE.search(input_text)
     if int_match:
         return "yes"
 
@@ -1,11 +1,15 @@
 from __future__ import annotations
+from dataclasses import dataclass
 import re
+from Auto_benchmark.io import fs
 
 __all__ = [
     "tddft_block_executed",
     "excitation_energy_exist",
     "oscillator_strengths_available",
     "check_output_tddft",
+    "TDDFTOutputFacts",
+    "scan_output_tddft",
 ]
 
 # Recognize both singlet and triplet TD-DFT/TDA excited-state sections
@@ -24,36 +28,72 @@ F_PATTERN = re.compile(r"\bf\s*=\s*[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?", re.I)
 # OPTIONAL: explicitly look for the fosc(D2) column token
 FOSC_HEADER_RE = re.compile(r"\bfosc\s*\(\s*D2\s*\)", re.I)
 
-def _blocks(text: str, header_re: re.Pattern) -> list[str]:
-    blocks: list[str] = []
-    for m in header_re.finditer(text):
-        start = m.end()
-        next_same = header_re.search(text, pos=start)
-        end = next_same.start() if next_same else len(text)
-        blocks.append(text[start:end])
-    return blocks
+# Lower-case literal each pattern starts with (for fs._find_anchor); a match can
+# only begin at an occurrence of it, so searching from the first one is exact.
+_TDDFT_ANCHOR = "td-dft"
+_ABS_ANCHOR = "absorption"
+_FOSC_ANCHOR = "fosc"
 
+def _search_from(pattern: re.Pattern, text: str, anchor: str):
+    pos = fs._find_anchor(text, anchor)
+    return pattern.search(text, pos) if pos >= 0 else None
 
-def _singlet_blocks(text: str) -> list[str]:
-    return _blocks(text, HEADER_SINGLET_RE)
+def _block_spans(text: str, header_re: re.Pattern) -> list[tuple[int, int]]:
+    """(start, end) offsets of each block body: from a header to the next one of the same kind."""
+    pos = fs._find_anchor(text, _TDDFT_ANCHOR)
+    if pos < 0:
+        return []
+    ms = list(header_re.finditer(text, pos))
+    ends = [m.start() for m in ms[1:]] + [len(text)]
+    return [(m.end(), end) for m, end in zip(ms, ends)]
 
 
-def _triplet_blocks(text: str) -> list[str]:
-    return _blocks(text, HEADER_TRIPLET_RE)
+def _singlet_spans(text: str) -> list[tuple[int, int]]:
+    return _block_spans(text, HEADER_SINGLET_RE)
+
+
+def _any_in_spans(pattern: re.Pattern, text: str, spans: list[tuple[int, int]]) -> bool:
+    return any(pattern.search(text, start, end) for start, end in spans)
+
+
+@dataclass(frozen=True, slots=True)
+class TDDFTOutputFacts:
+    """The three TDDFT output booleans, evaluated together."""
+    block_executed: bool
+    excitation_energy: bool
+    oscillator_strengths: bool
+
+
+def scan_output_tddft(out_text: str) -> TDDFTOutputFacts:
+    """
+    Evaluate the three TDDFT checks together. Singlet blocks are located once
+    and searched in place (no slicing), and the absorption-spectrum header is
+    looked up once, instead of once per check.
+    """
+    singlets = _singlet_spans(out_text)
+    executed = bool(singlets) or _search_from(HEADER_TRIPLET_RE, out_text, _TDDFT_ANCHOR) is not None
+    has_abs = _search_from(ABS_SPECTRUM_HDR_RE, out_text, _ABS_ANCHOR) is not None
+    energy = _any_in_spans(E_PATTERN, out_text, singlets) or has_abs
+    osc = _any_in_spans(F_PATTERN, out_text, singlets) or (
+        has_abs and _search_from(FOSC_HEADER_RE, out_text, _FOSC_ANCHOR) is not None
+    )
+    return TDDFTOutputFacts(executed, energy, osc)
     
 
 def tddft_block_executed(out_text: str) -> bool:
     """True if a TD-DFT/TDA excited-states (SINGLETS) block is present."""
-    return bool(_singlet_blocks(out_text) or _triplet_blocks(out_text))
+    return bool(
+        _search_from(HEADER_SINGLET_RE, out_text, _TDDFT_ANCHOR)
+        or _search_from(HEADER_TRIPLET_RE, out_text, _TDDFT_ANCHOR)
+    )
 
 def excitation_energy_exist(out_text: str) -> bool:
     """Energy evidence either as `E=` in singlet block OR in absorption spectrum table."""
     # 1) classic: E= inside the singlet block
-    for blk in _singlet_blocks(out_text):
-        if E_PATTERN.search(blk):
-            return True
+    if _any_in_spans(E_PATTERN, out_text, _singlet_spans(out_text)):
+        return True
     # 2) absorption-spectrum table lists energies in eV/nm — treat header presence as sufficient
-    if ABS_SPECTRUM_HDR_RE.search(out_text):
+    if _search_from(ABS_SPECTRUM_HDR_RE, out_text, _ABS_ANCHOR):
         return True
     return False
 
@@ -65,20 +105,20 @@ def oscillator_strengths_available(out_text: str) -> bool:
         with a 'fosc(D2)' column is present (ORCA's oscillator-strength table).
     """
     # 1) classic: f= in singlet blocks
-    for blk in _singlet_blocks(out_text):
-        if F_PATTERN.search(blk):
-            return True
+    if _any_in_spans(F_PATTERN, out_text, _singlet_spans(out_text)):
+        return True
 
     # 2) absorption-spectrum table with fosc(D2)
-    if ABS_SPECTRUM_HDR_RE.search(out_text) and FOSC_HEADER_RE.search(out_text):
+    if _search_from(ABS_SPECTRUM_HDR_RE, out_text, _ABS_ANCHOR) and _search_from(FOSC_HEADER_RE, out_text, _FOSC_ANCHOR):
         # If you want to be stricter, you could also require at least one numeric line below.
         return True
 
     return False
 
 def check_output_tddft(out_text: str) -> dict[str, str]:
+    facts = scan_output_tddft(out_text)
     return {
-        "TDDFT block executed?": "yes" if tddft_block_executed(out_text) else "no",
-        "Excitation energy exist?": "yes" if excitation_energy_exist(out_text) else "no",
-        "Oscillator strengths available?": "yes" if oscillator_strengths_available(out_text) else "no",
+        "TDDFT block executed?": "yes" if facts.block_executed else "no",
+        "Excitation energy exist?": "yes" if facts.excitation_energy else "no",
+        "Oscillator strengths available?": "yes" if facts.oscillator_strengths else "no",
     }
@@ -1,10 +1,14 @@
 from __future__ import annotations
 import re
+from Auto_benchmark.io import fs
 
 __all__ = [
     "scf_converged",
 ]
 
+SCF_CONVERGED_RE = re.compile(r"SCF converged", re.I)
+
 def scf_converged(text: str) -> bool:
     """True if the output contains 'SCF converged' (case-insensitive)."""
-    return bool(re.search(r"SCF converged", text, re.I))
+    pos = fs._find_anchor(text, "scf converged")
+    return pos >= 0 and bool(SCF_CONVERGED_RE.search(text, pos))
@@ -1,6 +1,7 @@
 # Auto_benchmark/Checks/ORCA/fukui_output.py
 from __future__ import annotations
 import re
+from Auto_benchmark.io import fs
 
 __all__ = [
     "mulliken_exist",
@@ -8,6 +9,26 @@ __all__ = [
     "loewdin_exist",
 ]
 
+MULLIKEN_RE = re.compile(r"\*\s*MULLIKEN\s+POPULATION\s+ANALYSIS\s*\*", re.IGNORECASE)
+HIRSHFELD_RE = re.compile(r"HIRSHFELD\s+ANALYSIS", re.IGNORECASE)
+LOEWDIN_RE = re.compile(r"\*\s*LOEWDIN\s+POPULATION\s+ANALYSIS\s*\*", re.IGNORECASE)
+
+def _search_banner(pattern: re.Pattern, text: str, anchor: str, starred: bool = False) -> bool:
+    """
+    `pattern.search(text)`, started at the first occurrence of its keyword
+    (see fs._find_anchor). For '* KEYWORD ... *' banners the match begins at
+    the star before the whitespace in front of the keyword, so step back
+    over that whitespace and one character.
+    """
+    pos = fs._find_anchor(text, anchor)
+    if pos < 0:
+        return False
+    if starred:
+        while pos > 0 and text[pos - 1].isspace():
+            pos -= 1
+        pos = max(pos - 1, 0)
+    return pattern.search(text, pos) is not None
+
 def mulliken_exist(text: str) -> bool:
     """
     Checks if Mulliken Population Analysis was performed.
@@ -15,7 +36,7 @@ def mulliken_exist(text: str) -> bool:
     Reference in example file:
     * MULLIKEN POPULATION ANALYSIS *
     """
-    return bool(re.search(r"\*\s*MULLIKEN\s+POPULATION\s+ANALYSIS\s*\*", text, re.IGNORECASE))
+    return _search_banner(MULLIKEN_RE, text, "mulliken", starred=True)
 
 
 def hirshfeld_exist(text: str) -> bool:
@@ -25,7 +46,7 @@ def hirshfeld_exist(text: str) -> bool:
     Reference in example file:
     HIRSHFELD ANALYSIS
     """
-    return bool(re.search(r"HIRSHFELD\s+ANALYSIS", text, re.IGNORECASE))
+    return _search_banner(HIRSHFELD_RE, text, "hirshfeld")
 
 
 def loewdin_exist(text: str) -> bool:
@@ -35,4 +56,4 @@ def loewdin_exist(text: str) -> bool:
     Reference in example file:
     * LOEWDIN POPULATION ANALYSIS *
     """
-    return bool(re.search(r"\*\s*LOEWDIN\s+POPULATION\s+ANALYSIS\s*\*", text, re.IGNORECASE))
+    return _search_banner(LOEWDIN_RE, text, "loewdin", starred=True)
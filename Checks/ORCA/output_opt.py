@@ -10,9 +10,24 @@ __all__ = [
 ]
 
 
+GEO_CONVERGED_RE = re.compile(r"\*+\s*HURRAY\s*\*+.*OPTIMIZATION HAS CONVERGED", re.I | re.S)
+# Convergence reported on the basis of negligible forces (no HURRAY banner)
+NEGLIGIBLE_FORCES_RE = re.compile(
+    r"OPTIMIZATION\s+COMPLETED\s+ON\s+THE\s+BASIS\s+OF\s+NEGLIGIBLE\s+FORCES", re.I
+)
+
+
 def geo_opt_converged(text: str) -> bool:
-    """True if the classic HURRAY / OPTIMIZATION HAS CONVERGED banner is present."""
-    return bool(re.search(r"\*+\s*HURRAY\s*\*+.*OPTIMIZATION HAS CONVERGED", text, re.I | re.S))
+    """
+    True if the classic HURRAY / OPTIMIZATION HAS CONVERGED banner is present,
+    or the optimization completed on the basis of negligible forces.
+    """
+    # Both literals are required; skip the (star-run backtracking) regex when either is absent.
+    if fs._find_anchor(text, "hurray") >= 0 and fs._find_anchor(text, "optimization has converged") >= 0:
+        if GEO_CONVERGED_RE.search(text):
+            return True
+    pos = fs._find_anchor(text, "optimization")
+    return pos >= 0 and NEGLIGIBLE_FORCES_RE.search(text, pos) is not None
 
 
 def imaginary_freq_not_exist(txt: str) -> bool:
@@ -1,4 +1,14 @@
 import re
+from Auto_benchmark.io import fs
+
+# Every heading contains "Gibbs free energy", so the alternation can start at
+# the first "gibbs" (a later Final/Total heading is still found via the bare form).
+DELTAG_RE = re.compile(
+    r"Final\s+Gibbs\s+free\s+energy"
+    r"|GIBBS\s+FREE\s+ENERGY"
+    r"|Total\s+Gibbs\s+free\s+energy",
+    re.I,
+)
 
 def deltaG_exists(text: str) -> bool:
     """
@@ -16,9 +26,5 @@ def deltaG_exists(text: str) -> bool:
     Raises:
         None.
     """
-    pats = [
-        r"Final\s+Gibbs\s+free\s+energy",
-        r"GIBBS\s+FREE\s+ENERGY",
-        r"Total\s+Gibbs\s+free\s+energy",
-    ]
-    return any(re.search(p, text, re.I) for p in pats)
+    pos = fs._find_anchor(text, "gibbs")
+    return pos >= 0 and DELTAG_RE.search(text, pos) is not None
@@ -65,3 +65,9 @@ YES_VALUES = {"yes", "y", "true", "1", "t"}
 NO_VALUES  = {"no", "n", "false", "0", "f"}
 
 NUM = re.compile(r"[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
+
+# -------- LLM extraction cache -------- #
+# Structured-output results are stored per (model, prompt version, schema, message).
+EXTRACTION_CACHE_DIR: str = "~/.cache/elagente/extractions"
+# Set this environment variable to a non-empty value to bypass the cache.
+EXTRACTION_CACHE_DISABLE_ENV: str = "ELAGENTE_NO_CACHE"
@@ -5,8 +5,8 @@ from typing import Dict, Any, List
 
 # Import the extractor
 from Auto_benchmark.Extractors.Fukui.extractor_Fukui import extract_fukui_charges
-# Import safe reader utility
-from Auto_benchmark.io.readers import read_text_safe
+# Import safe reader utility (memoized: check_outputs already read these files)
+from Auto_benchmark.io.readers import read_text_cached
 
 def calculate_fukui_indices(outs: List[Path]) -> Dict[str, Any]:
     """
@@ -74,7 +74,7 @@ def calculate_fukui_indices(outs: List[Path]) -> Dict[str, Any]:
     charge_data = {k: {} for k in file_map}
     for species, p in file_map.items():
         if p:
-            text = read_text_safe(p)
+            text = read_text_cached(p)
             charge_data[species] = extract_fukui_charges(text)
 
     # 5. Calculate Indices
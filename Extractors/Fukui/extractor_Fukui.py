@@ -1,7 +1,9 @@
 # Auto_benchmark/Extractors/Fukui/extractor_Fukui.py
 from __future__ import annotations
+from bisect import bisect_right
+from itertools import accumulate
 import re
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 __all__ = ["extract_fukui_charges"]
 
@@ -30,6 +32,10 @@ RE_LOEWDIN_BLOCK = re.compile(r"LOEWDIN\s+ATOMIC\s+CHARGES", re.IGNORECASE)
 # Captures: Group 1 (Index), Group 2 (Element), Group 3 (Charge)
 RE_LOEWDIN_LINE = re.compile(r"^\s*(\d+)\s+([A-Z][a-z]?)\s*:\s*([-+]?\d+\.\d+)", re.IGNORECASE)
 
+# Lower-case first words of the three headers. Every header line contains one,
+# so only lines holding an anchor need the header patterns above.
+_BLOCK_ANCHORS = ("mulliken", "hirshfeld", "loewdin")
+
 
 def _extract_block_charges(
     lines: list[str], 
@@ -79,6 +85,30 @@ def _extract_block_charges(
     return charges
 
 
+def _header_line_indices(text: str, n_lines: int) -> List[int]:
+    """
+    Indices (into `text.splitlines()`) of the lines that may hold a charge
+    header, in order; the caller still confirms each line. Literal `str.find`
+    over the lower-cased text replaces three regex searches per line.
+    """
+    if not text.isascii():
+        # IGNORECASE also folds some non-ASCII letters (e.g. KELVIN SIGN), and
+        # lower() may change offsets: keep the exhaustive line scan.
+        return list(range(n_lines))
+    low = text.lower()
+    starts = []
+    for anchor in _BLOCK_ANCHORS:
+        pos = low.find(anchor)
+        while pos >= 0:
+            starts.append(pos)
+            pos = low.find(anchor, pos + 1)
+    if not starts:
+        return []
+    # Line start offsets, exact for every separator splitlines() knows about.
+    offsets = list(accumulate((len(l) for l in text.splitlines(keepends=True)), initial=0))
+    return sorted({bisect_right(offsets, pos) - 1 for pos in starts})
+
+
 def extract_fukui_charges(text: str) -> Dict[str, Dict[int, float]]:
     """
     Extracts atomic partial charges for Carbon atoms (indices 0-6) 
@@ -106,7 +136,8 @@ def extract_fukui_charges(text: str) -> Dict[str, Dict[int, float]]:
     # We specifically want the 7 carbons of Toluene (indices 0 to 6)
     target_atom_indices = {0, 1, 2, 3, 4, 5, 6}
 
-    for i, line in enumerate(lines):
+    for i in _header_line_indices(text, len(lines)):
+        line = lines[i]
         # Check headers
         if RE_MULLIKEN_BLOCK.search(line):
             # Only parse if we haven't found it yet (or take the last one found)
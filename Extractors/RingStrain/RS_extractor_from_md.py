@@ -1,10 +1,12 @@
 from __future__ import annotations
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+import copy
 import re
 
 from pydantic import BaseModel, Field
 from ElAgente.Agent import StructureOutputAgent
+from Auto_benchmark.io.cache import BoundedCache
 
 # ---------- unicode normalization ----------
 # Normalize common Unicode punctuation to ASCII so regex works on negatives like “−13.88”
@@ -24,14 +26,15 @@ ROW_RE = re.compile(
     re.M,
 )
 
+_KCAL_RE = re.compile(r"kcal\s*/\s*mol", re.I)
+
 def _regex_table_extract(md: str) -> Dict[int, Dict[str, float]]:
-    md = _normalize(md)
-    # Require a kcal/mol context somewhere near the header to reduce false positives
-    header_ok = re.search(r"kcal\s*/\s*mol", md, re.I) is not None
+    """Table rows from already-normalized Markdown (see `_normalize`)."""
     out: Dict[int, Dict[str, float]] = {}
+    # Require a kcal/mol context somewhere near the header to reduce false positives
+    if _KCAL_RE.search(md) is None:
+        return out
     for m in ROW_RE.finditer(md):
-        if not header_ok:
-            continue
         n = int(m.group(1))
         dH = float(m.group(2))
         dG = float(m.group(3))
@@ -48,8 +51,8 @@ _REF_CHEX_RE = re.compile(
 )
 
 def _detect_cyclohexane_reference(md: str) -> bool:
-    md_norm = _normalize(md)
-    return _REF_CHEX_RE.search(md_norm) is not None
+    """Cyclohexane-as-reference check on already-normalized Markdown."""
+    return _REF_CHEX_RE.search(md) is not None
 
 # ---------- LLM schema ----------
 class RSRow(BaseModel):
@@ -73,10 +76,20 @@ def _num(x) -> Optional[float]:
     m = NUM_RE.search(s)
     return float(m.group(0)) if m else None
 
+# ---------- result cache ----------
+# Re-scoring re-reads the same report (and may hit the LLM fallback again), so
+# memoize on the file identity (path, mtime_ns, size).
+_EXTRACT_CACHE = BoundedCache(64)
+
+def clear_ringstrain_md_cache() -> None:
+    """Drop all memoized report extractions."""
+    _EXTRACT_CACHE.clear()
+
 # ---------- Public API ----------
 def extract_ringstrain_from_md(md_path: str) -> Dict[str, object]:
     """
     Parse a ring-strain section in kcal/mol from a Markdown report.
+    Results are cached per file version; callers get their own copy.
 
     Returns:
       {
@@ -88,7 +101,16 @@ def extract_ringstrain_from_md(md_path: str) -> Dict[str, object]:
         "reference_is_cyclohexane": True/False
       }
     """
-    md = Path(md_path).read_text(encoding="utf-8", errors="ignore")
+    st = Path(md_path).stat()
+    key = (str(md_path), st.st_mtime_ns, st.st_size)
+    hit = _EXTRACT_CACHE.get(key)
+    if hit is None:
+        hit = _extract_ringstrain_uncached(md_path)
+        _EXTRACT_CACHE.put(key, hit)
+    return copy.deepcopy(hit)
+
+def _extract_ringstrain_uncached(md_path: str) -> Dict[str, object]:
+    md = _normalize(Path(md_path).read_text(encoding="utf-8", errors="ignore"))
 
     # 1) Try deterministic table parse first (fast & robust when table formatting is clean)
     rows = _regex_table_extract(md)
@@ -112,7 +134,7 @@ def extract_ringstrain_from_md(md_path: str) -> Dict[str, object]:
         agent.append_system_message(s)
 
     result = agent.stream_return_graph_state(
-        "Extract a normalized rows array from this passage (kcal/mol):\n\n" + _normalize(md)
+        "Extract a normalized rows array from this passage (kcal/mol):\n\n" + md
     )
     agent.clear_memory()
     payload = result["structure_output"]
@@ -2,10 +2,13 @@
 from __future__ import annotations
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
+import os
 import re
 
 from .extractor_RS import extract_rs_core
 from Auto_benchmark.io import fs
+from Auto_benchmark.io.cache import BoundedCache
+from Auto_benchmark.Config import defaults
 from Auto_benchmark.Config.defaults import (
     HARTREE_TO_KCAL as _HARTREE_TO_KCAL,
     SKIP_DIRS,
@@ -67,46 +70,117 @@ def _load_mol_from_xyz(xyz_path: Path) -> Optional[Chem.Mol]:
     return m
 
 
-def _primary_xyz(folder: Path) -> Optional[Path]:
+# ===============================================================
+# Folder index (one directory listing per folder)
+# ===============================================================
+_XYZ_SPECIAL_RE = re.compile(r"(_trj|_initial)\.xyz$", re.I)
+_OUT_SUFFIX = OUT_GLOB.lstrip("*")
+
+
+def _folder_index(folder: Path) -> Dict[str, List[Path]]:
+    """
+    List `folder` once with os.scandir and bucket entries by suffix.
+
+    Returns a dict such as {".xyz": [...], ".out": [...], "dirs": [...]}; hidden
+    entries are skipped, matching the glob("*.ext") lookups this replaces.
+    """
+    idx: Dict[str, List[Path]] = {}
     try:
-        return fs._pick_primary_xyz(folder)  # type: ignore[attr-defined]
-    except Exception:
-        xyzs = sorted(folder.glob("*.xyz"))
-        return xyzs[0] if xyzs else None
+        with os.scandir(folder) as it:
+            for entry in it:
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir():
+                        idx.setdefault("dirs", []).append(Path(entry.path))
+                        continue
+                except OSError:
+                    continue
+                idx.setdefault(os.path.splitext(entry.name)[1], []).append(Path(entry.path))
+    except OSError:
+        pass
+    return idx
+
+
+def _primary_xyz_from_index(idx: Dict[str, List[Path]]) -> Optional[Path]:
+    """Same preference order as fs._pick_primary_xyz, without re-listing the folder."""
+    xyzs = sorted(idx.get(".xyz", []), key=lambda p: p.name)
+    if not xyzs:
+        return None
+    non_special = [p for p in xyzs if not _XYZ_SPECIAL_RE.search(p.name)]
+    if non_special:
+        return non_special[0]
+    initials = [p for p in xyzs if p.name.lower().endswith("_initial.xyz")]
+    if initials:
+        return initials[0]
+    return xyzs[0]
+
+
+def _primary_xyz(folder: Path) -> Optional[Path]:
+    return _primary_xyz_from_index(_folder_index(folder))
 
 # ===============================================================
 # .out discovery + energy extraction
 # ===============================================================
-def _read_primary_out(folder: Path) -> Optional[Path]:
-    try:
-        p = fs._read_primary_out(folder)  # type: ignore[attr-defined]
-        if p:
-            return p
-    except Exception:
-        pass
-    for child in sorted(folder.iterdir()):
-        if not child.is_dir():
-            continue
+def _pick_out(outs: List[Path]) -> Optional[Path]:
+    outs = [q for q in outs if not q.name.lower().startswith(SKIP_OUTFILE_PREFIXES)]
+    if not outs:
+        return None
+    exact = [q for q in outs if q.name.lower() == defaults.PRIMARY_OUT_FILENAME]
+    return exact[0] if exact else outs[0]
+
+
+def _primary_out_from_index(idx: Dict[str, List[Path]]) -> Optional[Path]:
+    p = _pick_out(idx.get(_OUT_SUFFIX, []))
+    if p:
+        return p
+    for child in sorted(idx.get("dirs", [])):
         if any(skip.lower() in child.name.lower() for skip in SKIP_DIRS):
             continue
-        outs = [q for q in child.glob(OUT_GLOB)]
-        outs = [q for q in outs if not q.name.lower().startswith(SKIP_OUTFILE_PREFIXES)]
-        if outs:
-            exact = [q for q in outs if q.name.lower() == "orca.out"]
-            return exact[0] if exact else outs[0]
+        p = _pick_out(_folder_index(child).get(_OUT_SUFFIX, []))
+        if p:
+            return p
     return None
 
 
-def _extract_HG_from_folder(folder: Path) -> Tuple[Optional[float], Optional[float]]:
-    outp = _read_primary_out(folder)
+def _read_primary_out(folder: Path) -> Optional[Path]:
+    return _primary_out_from_index(_folder_index(folder))
+
+
+# (H, G) per output file version (path, mtime_ns, size): rebuilding the energy
+# maps, or re-running a job in the same process, does not re-read and re-parse
+# unchanged outputs. Only the two floats are kept, not the (large) text.
+_HG_CACHE = BoundedCache(1024)
+
+
+def clear_energy_cache() -> None:
+    """Drop all memoized (H, G) extractions."""
+    _HG_CACHE.clear()
+
+
+def _extract_HG_from_index(idx: Dict[str, List[Path]]) -> Tuple[Optional[float], Optional[float]]:
+    outp = _primary_out_from_index(idx)
     if not outp:
         return (None, None)
     try:
-        txt = outp.read_text(errors="ignore")
-    except Exception:
+        st = os.stat(outp)
+    except OSError:
         return (None, None)
-    core = extract_rs_core(txt)
-    return core.get("H_total_au"), core.get("G_total_au")
+    key = (str(outp), st.st_mtime_ns, st.st_size)
+    hg = _HG_CACHE.get(key)
+    if hg is None:
+        try:
+            txt = outp.read_text(errors="ignore")
+        except Exception:
+            return (None, None)
+        core = extract_rs_core(txt)
+        hg = (core.get("H_total_au"), core.get("G_total_au"))
+        _HG_CACHE.put(key, hg)
+    return hg
+
+
+def _extract_HG_from_folder(folder: Path) -> Tuple[Optional[float], Optional[float]]:
+    return _extract_HG_from_index(_folder_index(folder))
 
 # ===============================================================
 # RDKit topology helpers (unchanged)
@@ -179,7 +253,7 @@ def _is_methylcyclo_single_ring(m: Chem.Mol) -> Optional[int]:
 # NEW: name-based fallback
 # ===============================================================
 _FORMULA_RE = re.compile(r"C(\d+)H\d+", re.I)
-def _infer_ring_from_name(folder: Path) -> Optional[Dict[str, Any]]:
+def _infer_ring_from_name(folder: Path, idx: Optional[Dict[str, List[Path]]] = None) -> Optional[Dict[str, Any]]:
     name = folder.name.lower()
     m = _FORMULA_RE.search(name)
     if not m:
@@ -188,7 +262,7 @@ def _infer_ring_from_name(folder: Path) -> Optional[Dict[str, Any]]:
         n = int(m.group(1))
     except Exception:
         return None
-    H, G = _extract_HG_from_folder(folder)
+    H, G = _extract_HG_from_index(idx if idx is not None else _folder_index(folder))
     if "_ch3" in name or "methyl" in name:
         return {"kind": "methyl", "ring_size": n - 1, "H_total_au": H, "G_total_au": G, "folder": folder}
     return {"kind": "cyclo", "ring_size": n, "H_total_au": H, "G_total_au": G, "folder": folder}
@@ -197,20 +271,21 @@ def _infer_ring_from_name(folder: Path) -> Optional[Dict[str, Any]]:
 # Classification + map builder (patched)
 # ===============================================================
 def _classify_folder(folder: Path) -> Optional[Dict[str, Any]]:
-    xyz = _primary_xyz(folder)
+    idx = _folder_index(folder)
+    xyz = _primary_xyz_from_index(idx)
     mol = _load_mol_from_xyz(xyz) if xyz else None
     if mol:
         n = _is_cycloalkane_single_ring(mol)
         if n is not None:
-            H, G = _extract_HG_from_folder(folder)
+            H, G = _extract_HG_from_index(idx)
             return {"kind": "cyclo", "ring_size": int(n), "H_total_au": H, "G_total_au": G, "folder": folder}
         m = _is_methylcyclo_single_ring(mol)
         if m is not None:
-            H, G = _extract_HG_from_folder(folder)
+            H, G = _extract_HG_from_index(idx)
             return {"kind": "methyl", "ring_size": int(m), "H_total_au": H, "G_total_au": G, "folder": folder}
 
     # RDKit failed → use fallback
-    return _infer_ring_from_name(folder)
+    return _infer_ring_from_name(folder, idx)
 
 
 def build_structure_energy_maps(root: Path) -> Tuple[Dict[int, Dict[str, Any]], Dict[int, Dict[str, Any]]]:
@@ -6,6 +6,7 @@ import re
 
 from pydantic import BaseModel, Field
 from ElAgente.Agent import StructureOutputAgent
+from Auto_benchmark.io.cache import BoundedCache
 
 # ----------------------------
 # Schema for LLM fallback
@@ -20,6 +21,7 @@ class Result(BaseModel):
 
 EV_PER_HARTREE = 27.211386245988  # for au/Hartree → eV
 AU_WORDS = re.compile(r"\b(?:au|a\.?u\.?|hartree|hartrees)\b", re.I)
+NUM_RE = re.compile(r"[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?")
 
 def _coerce_num(val) -> Optional[float]:
     """Extract first numeric token; tolerate strings like '2.13 eV' or 'Do Not Exist'."""
@@ -30,7 +32,7 @@ def _coerce_num(val) -> Optional[float]:
     s = str(val).strip()
     if s.lower() in {"", "none", "null", "do not exist", "n/a"}:
         return None
-    m = re.search(r"[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?", s)
+    m = NUM_RE.search(s)
     if not m:
         return None
     try:
@@ -50,6 +52,8 @@ def _maybe_convert_au(number: Optional[float], local_text: str) -> Optional[floa
 # Sectionization & molecule slicing
 # ----------------------------
 HEADER_RE = re.compile(r"(?m)^(#{1,6})\s+(.*)$")
+MOL_NAME_RE = re.compile(r"([a-zA-Z_\-]*)(\d+)$")   # 'mol3' → ('mol', '3')
+EV_NUMBER_RE = re.compile(r"\b\d+(?:\.\d+)?\s*eV\b", re.I)
 
 def _aliases_for(name: str) -> list[str]:
     """
@@ -58,7 +62,7 @@ def _aliases_for(name: str) -> list[str]:
     """
     s = name.strip()
     aliases = {s, s.replace("_", " "), s.replace("_", "-")}
-    m = re.match(r"([a-zA-Z_\-]*)(\d+)$", s)
+    m = MOL_NAME_RE.match(s)
     if m:
         prefix, num = m.group(1), m.group(2)
         base = prefix.rstrip("_- ").lower() or "mol"
@@ -89,21 +93,37 @@ def _split_sections(md_text: str) -> List[Tuple[str, str, int, int]]:
         sections.append((head_text, md_text[body_start:body_end], start, body_end))
     return sections
 
-def _score_section(header: str, body: str, aliases: List[str]) -> float:
+# Per-report section index: (header.lower(), body, body.lower()[:300], has eV numbers).
+# Built once per report text and shared by every molecule folder, instead of
+# re-splitting and re-lowercasing the report for each one. Keyed on the text
+# itself (the decoded report string is reused, so its hash is computed once).
+_SECTION_INDEX_CACHE = BoundedCache(4)
+
+def _section_index(md_text: str) -> List[Tuple[str, str, str, bool]]:
+    index = _SECTION_INDEX_CACHE.get(md_text)
+    if index is None:
+        index = [
+            (head.lower(), body, body.lower()[:300], EV_NUMBER_RE.search(body) is not None)
+            for head, body, _, _ in _split_sections(md_text)
+        ]
+        _SECTION_INDEX_CACHE.put(md_text, index)
+    return index
+
+def _score_section(entry: Tuple[str, str, str, bool], aliases_lower: List[str]) -> float:
     """
-    Score a section for how likely it refers to one of the aliases.
+    Score an indexed section (see `_section_index`) for how likely it refers
+    to one of the (lower-cased) aliases.
       - +2 if alias in header
       - +1 if alias in first 300 chars of body
       - +1 if body contains any 'eV' numbers (we want TDDFT numerics in eV)
     """
+    h, _, b300, has_ev = entry
     score = 0.0
-    h = header.lower()
-    b = body.lower()
-    if any(a.lower() in h for a in aliases):
+    if any(a in h for a in aliases_lower):
         score += 2.0
-    if any(a.lower() in b[:300] for a in aliases):
+    if any(a in b300 for a in aliases_lower):
         score += 1.0
-    if re.search(r"\b\d+(?:\.\d+)?\s*eV\b", body, re.I):
+    if has_ev:
         score += 1.0
     return score
 
@@ -119,19 +139,19 @@ def _slice_for_molecule(md_text: str, molecule: Optional[str]) -> str:
         return md_text
 
     aliases = _aliases_for(molecule)
-    sections = _split_sections(md_text)
+    aliases_lower = [a.lower() for a in aliases]
 
     # 1) pick best section
     best = None
     best_score = -1.0
-    for head, body, s, e in sections:
-        sc = _score_section(head, body, aliases)
+    for entry in _section_index(md_text):
+        sc = _score_section(entry, aliases_lower)
         if sc > best_score:
             best_score = sc
-            best = (head, body, s, e)
+            best = entry[1]
 
-    if best and best_score >= 2.0:
-        return best[1]  # body
+    if best is not None and best_score >= 2.0:
+        return best
 
     # 2) line-anchored window
     for alias in aliases:
@@ -141,7 +161,7 @@ def _slice_for_molecule(md_text: str, molecule: Optional[str]) -> str:
             start = max(0, m.start() - 2000)
             end = min(len(md_text), m.end() + 4000)
             block = md_text[start:end]
-            if re.search(r"\b\d+(?:\.\d+)?\s*eV\b", block, re.I):
+            if EV_NUMBER_RE.search(block):
                 return block
 
     # 3) fallback
@@ -171,6 +191,17 @@ FOSC_PAT = re.compile(
     re.I,
 )
 
+def _derive_missing(data: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    """Fill one of S1 / T1 / gap from the other two (gap = S1 - T1). Mutates and returns `data`."""
+    s1, t1, gap = data["S1_energy_eV"], data["T1_energy_eV"], data["S1_T1_gap_eV"]
+    if s1 is not None and t1 is not None and gap is None:
+        data["S1_T1_gap_eV"] = s1 - t1
+    elif s1 is not None and gap is not None and t1 is None:
+        data["T1_energy_eV"] = s1 - gap
+    elif t1 is not None and gap is not None and s1 is None:
+        data["S1_energy_eV"] = t1 + gap
+    return data
+
 def _regex_extract(md_text: str, molecule: Optional[str]) -> Dict[str, Optional[float]]:
     text = _slice_for_molecule(md_text, molecule)
 
@@ -196,19 +227,12 @@ def _regex_extract(md_text: str, molecule: Optional[str]) -> Dict[str, Optional[
         fosc = _coerce_num(fm.group(1))
 
     # derive missing values when possible
-    if s1 is not None and t1 is not None and gap is None:
-        gap = s1 - t1
-    if s1 is not None and gap is not None and t1 is None:
-        t1 = s1 - gap
-    if t1 is not None and gap is not None and s1 is None:
-        s1 = t1 + gap
-
-    return {
+    return _derive_missing({
         "S1_energy_eV": s1,
         "S1_oscillator_strength": fosc,
         "T1_energy_eV": t1,
         "S1_T1_gap_eV": gap,
-    }
+    })
 
 # ----------------------------
 # LLM fallback (fill only what regex missed)
@@ -251,15 +275,44 @@ def _llm_extract(md_text: str, molecule: Optional[str]) -> Dict[str, Optional[fl
     }
 
     # derive again if needed
-    s1, t1, gap = out["S1_energy_eV"], out["T1_energy_eV"], out["S1_T1_gap_eV"]
-    if s1 is not None and t1 is not None and gap is None:
-        out["S1_T1_gap_eV"] = s1 - t1
-    if s1 is not None and gap is not None and t1 is None:
-        out["T1_energy_eV"] = s1 - gap
-    if t1 is not None and gap is not None and s1 is None:
-        out["S1_energy_eV"] = t1 + gap
+    return _derive_missing(out)
 
-    return out
+# ----------------------------
+# Result cache
+# ----------------------------
+# The same report is queried once per molecule folder, so memoize on the file
+# identity (path, mtime_ns, size). Full results are keyed additionally by molecule;
+# the molecule-independent whole-document regex pass is shared across molecules.
+_EXTRACT_CACHE = BoundedCache(256)
+_DOC_REGEX_CACHE = BoundedCache(256)
+# Decoded report text, so N molecule folders decode the report once, not N times.
+# Reports can be large, so only the few most recent are kept.
+_TEXT_CACHE = BoundedCache(4)
+
+def _file_key(md_path: str) -> Tuple[str, int, int]:
+    st = Path(md_path).stat()
+    return (str(md_path), st.st_mtime_ns, st.st_size)
+
+def _doc_regex_extract(md_text: str, file_key: Tuple[str, int, int]) -> Dict[str, Optional[float]]:
+    """Whole-document regex pass (no molecule slicing), cached per file."""
+    hit = _DOC_REGEX_CACHE.get(file_key)
+    if hit is None:
+        hit = _regex_extract(md_text, molecule=None)
+        _DOC_REGEX_CACHE.put(file_key, hit)
+    return dict(hit)
+
+def _read_report(md_path: str, file_key: Tuple[str, int, int]) -> str:
+    """Report text, decoded once per file version."""
+    text = _TEXT_CACHE.get(file_key)
+    if text is None:
+        text = Path(md_path).read_text(encoding="utf-8", errors="ignore")
+        _TEXT_CACHE.put(file_key, text)
+    return text
+
+def clear_tddft_md_cache() -> None:
+    """Drop all memoized report extractions."""
+    for cache in (_EXTRACT_CACHE, _DOC_REGEX_CACHE, _TEXT_CACHE, _SECTION_INDEX_CACHE):
+        cache.clear()
 
 # ----------------------------
 # Public API
@@ -278,15 +331,26 @@ def extract_tddft_from_md(md_path: str, molecule: Optional[str] = None) -> Dict[
       on that section but falls back to the whole report if needed.
     - Regex pass first; LLM fallback only fills missing fields.
     - Derives missing values when possible (gap, T1, or S1).
+    - Results are memoized per (file, mtime, size, molecule); editing the
+      report invalidates the entry.
     """
-    md_text = Path(md_path).read_text(encoding="utf-8", errors="ignore")
+    fkey = _file_key(md_path)
+    key = (*fkey, molecule)
+    cached = _EXTRACT_CACHE.get(key)
+    if cached is not None:
+        return dict(cached)
+
+    md_text = _read_report(md_path, fkey)
 
     # pass 1: regex scoped to molecule
-    data = _regex_extract(md_text, molecule)
+    data = _regex_extract(md_text, molecule) if molecule else _doc_regex_extract(md_text, fkey)
 
     # if mostly empty, retry regex on full doc before LLM
     if sum(v is None for v in data.values()) >= 3 and molecule:
-        data = _regex_extract(md_text, molecule=None)
+        data = _doc_regex_extract(md_text, fkey)
+
+    # close S1/T1/gap by derivation first; the LLM only runs if a field is still missing
+    _derive_missing(data)
 
     # LLM fills only what’s missing (stays molecule-scoped if we had a good slice)
     if any(v is None for v in data.values()):
@@ -297,12 +361,7 @@ def extract_tddft_from_md(md_path: str, molecule: Optional[str] = None) -> Dict[
                 data[k] = llm_data[k]
 
     # final derivation
-    s1, t1, gap = data["S1_energy_eV"], data["T1_energy_eV"], data["S1_T1_gap_eV"]
-    if s1 is not None and t1 is not None and gap is None:
-        data["S1_T1_gap_eV"] = s1 - t1
-    if s1 is not None and gap is not None and t1 is None:
-        data["T1_energy_eV"] = s1 - gap
-    if t1 is not None and gap is not None and s1 is None:
-        data["S1_energy_eV"] = t1 + gap
+    _derive_missing(data)
 
+    _EXTRACT_CACHE.put(key, dict(data))
     return data
\ No newline at end of file
@@ -3,6 +3,8 @@ import re
 from dataclasses import dataclass
 from typing import Optional, List, Tuple, Dict
 
+import numpy as np
+
 __all__ = [
     "SINGLET_HEADER_RE",
     "TRIPLET_HEADER_RE",
@@ -11,6 +13,7 @@ __all__ = [
     "parse_triplet_states",
     "get_S1",
     "get_T1",
+    "parse_absorption_rows",
     "s1_oscillator_from_absorption",
     "extract_tddft_core",
 ]
@@ -31,11 +34,14 @@ TRIPLET_HEADER_RE = re.compile(
 #
 # We capture "E=<number><unit?>" and also look for any explicit "<number> eV"
 # anywhere else on the same line and prefer that value.
+#
+# Every quantifier is confined to the current line ([ \t] / [^\n]) so a failed
+# attempt can never backtrack across the (often very long) rest of the file.
 STATE_LINE_RE = re.compile(
-    r"^\s*STATE\s*(?P<idx>\d+)\s*:\s*"
-    r"(?:.*?)\bE\s*=\s*(?P<eval>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s*"
+    r"^[ \t]*STATE[ \t]*(?P<idx>\d+)[ \t]*:[ \t]*"
+    r"[^\n]*?\bE[ \t]*=[ \t]*(?P<eval>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]*"
     r"(?P<eunit>eV|cm\^?\*?-?1|cm-1|nm|au|a\.?u\.?|hartree|hartrees)?"
-    r"(?:.*?\bf\s*=\s*(?P<fval>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?))?",
+    r"(?:[^\n]*?\bf[ \t]*=[ \t]*(?P<fval>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?))?",
     re.I | re.M,
 )
 
@@ -53,10 +59,10 @@ ABS_HEADER_RE = re.compile(
 #  0-1A  ->  1-1A'     2.1342      17213.7       581.0     0.04425 ...
 # Columns we care about: e_eV, e_cm^-1, wavelength_nm, fosc
 ABS_ROW_RE = re.compile(
-    r"^\s*0-\S+\s*->\s*(?P<final>\d-\S+)\s+"
-    r"(?P<e_ev>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s+"
-    r"(?P<e_cm>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s+"
-    r"(?P<wl_nm>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)\s+"
+    r"^[ \t]*0-[^\s-]+[ \t]*->[ \t]*(?P<final>\d-\S+)[ \t]+"
+    r"(?P<e_ev>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+"
+    r"(?P<e_cm>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+"
+    r"(?P<wl_nm>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)[ \t]+"
     r"(?P<fosc>[-+]?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?)",
     re.M,
 )
@@ -112,22 +118,29 @@ class TDState:
     raw_line: str = ""
 
 # ---------------- Block slicing ---------------- #
-def _blocks(text: str, header_re: re.Pattern, other_header_re: re.Pattern) -> List[str]:
-    """Slice sub-blocks starting at header_re and ending at next header or EOF."""
-    blocks: List[str] = []
-    for m in header_re.finditer(text):
-        start = m.end()
-        next_same = header_re.search(text, pos=start)
-        next_other = other_header_re.search(text, pos=start)
-        stops = [x.start() for x in (next_same, next_other) if x]
-        end = min(stops) if stops else len(text)
-        blocks.append(text[start:end])
-    return blocks
-
-def _parse_states_from_blocks(text: str, header_re: re.Pattern, other_header_re: re.Pattern) -> List[TDState]:
+def _block_spans(text: str) -> List[Tuple[int, int, str]]:
+    """
+    Return (start, end, kind) spans for every SINGLET ('S') / TRIPLET ('T') block.
+
+    Both header kinds are located in one pass each; a block runs from the end of
+    its header to the start of the next header of either kind (or EOF).
+    """
+    heads = sorted(
+        [(m.start(), m.end(), "S") for m in SINGLET_HEADER_RE.finditer(text)]
+        + [(m.start(), m.end(), "T") for m in TRIPLET_HEADER_RE.finditer(text)]
+    )
+    spans: List[Tuple[int, int, str]] = []
+    for i, (_, body_start, kind) in enumerate(heads):
+        end = heads[i + 1][0] if i + 1 < len(heads) else len(text)
+        spans.append((body_start, end, kind))
+    return spans
+
+def _parse_states_from_blocks(text: str, kind: str) -> List[TDState]:
     states: List[TDState] = []
-    for blk in _blocks(text, header_re, other_header_re):
-        for m in STATE_LINE_RE.finditer(blk):
+    for start, end, blk_kind in _block_spans(text):
+        if blk_kind != kind:
+            continue
+        for m in STATE_LINE_RE.finditer(text, start, end):
             idx = int(m.group("idx"))
             e_val = float(m.group("eval"))
             e_unit = m.group("eunit")
@@ -143,11 +156,11 @@ def _parse_states_from_blocks(text: str, header_re: re.Pattern, other_header_re:
 # ---------------- Public parsers ---------------- #
 def parse_singlet_states(text: str) -> List[TDState]:
     """Return parsed singlet states (sorted by index)."""
-    return _parse_states_from_blocks(text, SINGLET_HEADER_RE, TRIPLET_HEADER_RE)
+    return _parse_states_from_blocks(text, "S")
 
 def parse_triplet_states(text: str) -> List[TDState]:
     """Return parsed triplet states (sorted by index)."""
-    return _parse_states_from_blocks(text, TRIPLET_HEADER_RE, SINGLET_HEADER_RE)
+    return _parse_states_from_blocks(text, "T")
 
 def get_S1(text: str) -> Optional[TDState]:
     """Return the first singlet state (S1) if present."""
@@ -168,23 +181,47 @@ def _absorption_block(text: str) -> Optional[str]:
     # The table is compact; a few thousand chars are usually plenty.
     return text[start : start + 8000]
 
+def parse_absorption_rows(out_text: str) -> Tuple[List[str], np.ndarray]:
+    """
+    Parse every transition row of the absorption spectrum table in one go.
+
+    Returns (final_state_labels, rows) where `rows` is an (N, 4) float array with
+    columns (e_eV, e_cm^-1, wavelength_nm, fosc). Regular whitespace-separated
+    rows are split directly; anything irregular falls back to ABS_ROW_RE.
+    """
+    blk = _absorption_block(out_text)
+    finals: List[str] = []
+    values: List[List[float]] = []
+    if blk:
+        for line in blk.splitlines():
+            if "->" not in line or not line.lstrip().startswith("0-"):
+                continue
+            tok = line.split()
+            if len(tok) >= 7 and tok[1] == "->" and tok[2][:1].isdigit() and tok[2][1:2] == "-":
+                try:
+                    values.append([float(x) for x in tok[3:7]])
+                    finals.append(tok[2])
+                    continue
+                except ValueError:
+                    pass
+            m = ABS_ROW_RE.match(line)
+            if m:
+                finals.append(m.group("final"))
+                values.append([float(m.group(k)) for k in ("e_ev", "e_cm", "wl_nm", "fosc")])
+    rows = np.asarray(values, dtype=float).reshape(-1, 4)
+    return finals, rows
+
 def s1_oscillator_from_absorption(out_text: str) -> Tuple[Optional[float], Optional[float], Optional[float]]:
     """
     Return (fosc, energy_eV, wavelength_nm) for the first *singlet* excited state S1
     from the absorption spectrum table. If not found, returns (None, None, None).
     """
-    blk = _absorption_block(out_text)
-    if not blk:
-        return None, None, None
-    for m in ABS_ROW_RE.finditer(blk):
+    finals, rows = parse_absorption_rows(out_text)
+    for i, final in enumerate(finals):
         # final like "1-1A", "1-1A'", "1-1A1", etc. (index 1, multiplicity 1 → singlet)
-        final = m.group("final")
-        # Require the target state index "1-" and multiplicity "1" for S1
-        if re.match(r"1-1\S*", final):
-            fosc = float(m.group("fosc"))
-            e_ev = float(m.group("e_ev"))
-            wl_nm = float(m.group("wl_nm"))
-            return fosc, e_ev, wl_nm
+        if final.startswith("1-1"):
+            e_ev, _, wl_nm, fosc = rows[i]
+            return float(fosc), float(e_ev), float(wl_nm)
     return None, None, None
 
 # ---------------- Core extraction API ---------------- #
@@ -0,0 +1,112 @@
+# Auto_benchmark/Extractors/extraction_cache.py
+"""
+On-disk, content-addressed cache for structured-output LLM extractions.
+
+Re-running a benchmark re-parses the same report text with the same model
+and schema; the cache turns that multi-second agent round-trip into a hash
+plus a small JSON read. Entries are keyed by a SHA-256 over the
+length-prefixed (provider, model, prompt version, schema JSON, message)
+tuple, so changing any of them simply misses.
+
+Disable with the environment variable named by
+`defaults.EXTRACTION_CACHE_DISABLE_ENV` (ELAGENTE_NO_CACHE=1).
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Any, Dict, Optional, Type
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from pydantic import BaseModel
+
+from Auto_benchmark.Config import defaults
+
+__all__ = ["ExtractionCache", "cache_disabled"]
+
+
+def cache_disabled() -> bool:
+    """True when the opt-out environment variable is set to a non-empty value."""
+    return bool(os.environ.get(defaults.EXTRACTION_CACHE_DISABLE_ENV))
+
+
+def _schema_json(schema_cls: Type[BaseModel]) -> str:
+    return json.dumps(schema_cls.model_json_schema(), sort_keys=True, separators=(",", ":"))
+
+
+class ExtractionCache:
+    """
+    JSON-file cache of structured-output results.
+
+    Args:
+        root: Cache directory (default: `defaults.EXTRACTION_CACHE_DIR`).
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root or defaults.EXTRACTION_CACHE_DIR).expanduser()
+
+    @staticmethod
+    def make_key(
+        *,
+        provider: str,
+        model: str,
+        prompt_version: str,
+        schema_cls: Type[BaseModel],
+        message: str,
+    ) -> str:
+        """SHA-256 hex digest over the 8-byte length-prefixed key parts."""
+        h = hashlib.sha256()
+        for part in (provider, model, prompt_version, _schema_json(schema_cls), message):
+            data = part.encode("utf-8")
+            h.update(len(data).to_bytes(8, "big"))
+            h.update(data)
+        return h.hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def get(self, key: str, schema_cls: Type[BaseModel]) -> Optional[Dict[str, Any]]:
+        """
+        Return the cached result for `key`, or None on miss.
+
+        Entries that no longer validate against `schema_cls` count as misses.
+        """
+        if cache_disabled():
+            return None
+        try:
+            entry = json.loads(self._path(key).read_text(encoding="utf-8"))
+            result = entry["result"]
+            schema_cls.model_validate(result)
+        except Exception:
+            return None
+        return result
+
+    def put(self, key: str, result: Any, *, model: str, schema_cls: Type[BaseModel]) -> None:
+        """
+        Store `result` (dict or pydantic model) atomically (temp file + rename).
+        Write failures are ignored: the cache is an optimization only.
+        """
+        if cache_disabled():
+            return
+        if isinstance(result, BaseModel):
+            result = result.model_dump()
+        entry = {
+            "result": result,
+            "model": model,
+            "schema_hash": hashlib.sha256(_schema_json(schema_cls).encode("utf-8")).hexdigest(),
+            "ts": time.time(),
+        }
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as fh:
+                    json.dump(entry, fh)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except (OSError, TypeError, ValueError):
+            pass
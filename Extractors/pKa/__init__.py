@@ -4,6 +4,7 @@ from .pKa_extract_from_md import (
     Result,
     test_expert,
     extract_pka_from_md,
+    extract_pka_from_mds,
 )
 
 from .extractor_pKa import (
@@ -24,6 +25,7 @@ __all__ = [
     "Result",
     "test_expert",
     "extract_pka_from_md",
+    "extract_pka_from_mds",
 
     # ORCA .out extractor
     "extract_pka_orca_core",
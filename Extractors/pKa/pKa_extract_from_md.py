@@ -1,10 +1,13 @@
 # Auto_benchmark/Extractors/pKa/LLM_for_extractions_pKa.py
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Iterable, Optional, List, Tuple, Union
 import re
+import threading
 from pydantic import BaseModel, Field
 from ElAgente.Agent import StructureOutputAgent
+from Auto_benchmark.Extractors.extraction_cache import ExtractionCache
 
 class Result(BaseModel):
     """
@@ -15,32 +18,66 @@ class Result(BaseModel):
     regression model.
 
     Attributes:
-        pKa_of_chlorofluoroacetic_acid (float | str):
+        pKa_of_chlorofluoroacetic_acid (Optional[float]):
             The reported pKa of chlorofluoroacetic acid. Use a numeric value
-            when the text provides one; otherwise set the string
-            "Do Not Exist" to indicate the value is not reported.
+            when the text provides one; otherwise null to indicate the value
+            is not reported.
         has_linear_regression_model (bool):
             True if the text explicitly indicates the presence of a linear
             regression (e.g., mentions "linear regression", provides an
             equation such as y = ax + b, or reports R²/R^2); False otherwise.
     """
-    pKa_of_chlorofluoroacetic_acid: float | str = Field(
-        ..., description="the pka value of the chlorofluoroacetic_acid, Do Not Exist if not reported"
+    pKa_of_chlorofluoroacetic_acid: Optional[float] = Field(
+        None, description="the pka value of the chlorofluoroacetic_acid, null if not reported"
     )
     has_linear_regression_model: bool = Field(
         ..., description="True if the text explicitly reports a linear regression model (mentions 'linear regression', an equation, or R²)."
     )
 
+# Agents keep conversation state between stream/clear calls, so each thread
+# gets its own (built once per thread and model/schema).
+_AGENTS = threading.local()
+
+def _get_agent(model: str, schema_cls: type) -> StructureOutputAgent:
+    """Build (once per thread and model/schema) the parsing agent reused by test_expert."""
+    agents = getattr(_AGENTS, "by_key", None)
+    if agents is None:
+        agents = _AGENTS.by_key = {}
+    agent = agents.get((model, schema_cls))
+    if agent is None:
+        agent = StructureOutputAgent(model=model, agent_schema=schema_cls)
+        agent.append_system_message("You are a parsing agent.")
+        agent.append_system_message("")
+        agents[(model, schema_cls)] = agent
+    return agent
+
+# Bump _PROMPT_VERSION whenever the system messages above change, so cached
+# extractions made with the old prompt are not reused.
+_PROVIDER = "openai"
+_MODEL = "gpt-4o"
+_PROMPT_VERSION = "pka-1"
+_CACHE = ExtractionCache()
+
 def test_expert(message2agent: str):
     """
     Parses a message with a structured-output agent and returns schema-validated fields.
+    Results are served from the on-disk extraction cache when the same message
+    was already parsed with the same model/prompt/schema.
     """
-    agent = StructureOutputAgent(model="gpt-4o", agent_schema=Result)
-    agent.append_system_message("You are a parsing agent.")
-    agent.append_system_message("")
+    key = ExtractionCache.make_key(
+        provider=_PROVIDER, model=_MODEL, prompt_version=_PROMPT_VERSION,
+        schema_cls=Result, message=message2agent,
+    )
+    cached = _CACHE.get(key, Result)
+    if cached is not None:
+        return cached
+
+    agent = _get_agent(_MODEL, Result)
     result = agent.stream_return_graph_state(message2agent)
     agent.clear_memory()
-    return result["structure_output"]
+    output = result["structure_output"]
+    _CACHE.put(key, output, model=_MODEL, schema_cls=Result)
+    return output
 
 # ----------------------------------------------------------
 # Helpers & Regex (TDDFT-style mechanism)
@@ -58,10 +95,17 @@ CFAA_ALIASES = [
     r"CFAA",                          # abbreviation if used in report
 ]
 
+# All aliases folded into one compiled alternation (one scan instead of one per alias);
+# PKA_PAT_NEAR embeds the same alternation so the two cannot drift apart.
+CFAA_ANY_RE = re.compile("(?:" + "|".join(CFAA_ALIASES) + ")", re.I)
+# Lower-case literal(s) shared by every alias, for a cheap substring prefilter
+_CFAA_LITERAL_ROOTS = ("chloro", "cfaa")
+
 # pKa capture (accepts “pKa”, “pK_a”, “pK a”, etc.), possibly with “=”, “:”, or whitespace
 PKA_TOKEN = r"p\s*K\s*_?a"
+PKA_TOKEN_RE = re.compile(PKA_TOKEN, re.I)
 PKA_PAT_NEAR = re.compile(
-    rf"(?P<name>{'|'.join(CFAA_ALIASES)})[^.\n]{{0,120}}?(?:{PKA_TOKEN})[^0-9\-+]*({NUM_RE.pattern})",
+    rf"(?P<name>{CFAA_ANY_RE.pattern})[^.\n]{{0,120}}?(?:{PKA_TOKEN})[^0-9\-+]*({NUM_RE.pattern})",
     re.I,
 )
 PKA_PAT_GENERIC = re.compile(
@@ -76,6 +120,7 @@ LINREG_PAT = re.compile(
 )
 
 def _coerce_num(val) -> Optional[float]:
+    """Lenient number coercion for free-form (LLM) values; regex captures use float() directly."""
     if val is None:
         return None
     if isinstance(val, (int, float)):
@@ -108,15 +153,22 @@ def _split_sections(md_text: str) -> List[Tuple[str, str, int, int]]:
         sections.append((head_text, md_text[body_start:body_end], m.start(), body_end))
     return sections
 
+def _mentions_cfaa(text_lower: str) -> bool:
+    # Every alias contains one of the literal roots; str `in` is far cheaper
+    # than the regex, which then only runs on sections that pass the probe.
+    if not any(root in text_lower for root in _CFAA_LITERAL_ROOTS):
+        return False
+    return CFAA_ANY_RE.search(text_lower) is not None
+
 def _score_section_for_cfaa(header: str, body: str) -> float:
     h = header.lower()
-    b = body.lower()
+    b = body[:300].lower()  # only the opening of the body is checked for a name
     score = 0.0
-    if any(re.search(alias, h, re.I) for alias in CFAA_ALIASES):
+    if _mentions_cfaa(h):
         score += 2.0
-    if any(re.search(alias, b[:300], re.I) for alias in CFAA_ALIASES):
+    if _mentions_cfaa(b):
         score += 1.0
-    if re.search(PKA_TOKEN, body, re.I):
+    if PKA_TOKEN_RE.search(body):
         score += 1.0
     return score
 
@@ -137,38 +189,38 @@ def _slice_for_cfaa(md_text: str) -> str:
         return best[1]
 
     # window around first explicit alias
-    for alias in CFAA_ALIASES:
-        m = re.search(alias, md_text, re.I)
-        if m:
-            start = max(0, m.start() - 2000)
-            end = min(len(md_text), m.end() + 4000)
-            return md_text[start:end]
+    m = CFAA_ANY_RE.search(md_text)
+    if m:
+        start = max(0, m.start() - 2000)
+        end = min(len(md_text), m.end() + 4000)
+        return md_text[start:end]
 
     return md_text
 
 # ----------------------------------------------------------
 # Deterministic (regex) extractor
 # ----------------------------------------------------------
-def _regex_extract(md_text: str) -> Dict[str, Optional[float | bool]]:
-    focus = _slice_for_cfaa(md_text)
+def _regex_extract(md_text: str, focus: Optional[str] = None) -> Dict[str, Optional[float | bool]]:
+    if focus is None:
+        focus = _slice_for_cfaa(md_text)
 
     # Prefer a pKa matched near the compound name
     pka_val: Optional[float] = None
     m = PKA_PAT_NEAR.search(focus)
     if m:
-        pka_val = _coerce_num(m.group(2))
+        pka_val = float(m.group(2))  # NUM_RE-validated, float() cannot fail
 
     # If not found, use a generic pKa in the focused region (but still scoped)
     if pka_val is None:
         mg = PKA_PAT_GENERIC.search(focus)
         if mg:
-            pka_val = _coerce_num(mg.group(1))
+            pka_val = float(mg.group(1))
 
     # Linear regression detection (scoped region)
     has_linreg: Optional[bool] = None
-    if re.search(LINREG_PAT, focus):
+    if LINREG_PAT.search(focus):
         has_linreg = True
-    elif re.search(LINREG_PAT, md_text):
+    elif LINREG_PAT.search(md_text):
         # fall back to whole doc if strongly indicated elsewhere
         has_linreg = True
     else:
@@ -182,8 +234,9 @@ def _regex_extract(md_text: str) -> Dict[str, Optional[float | bool]]:
 # ----------------------------------------------------------
 # LLM fallback (fill what regex missed) — uses your test_expert
 # ----------------------------------------------------------
-def _llm_extract(md_text: str) -> Dict[str, Optional[float | bool]]:
-    focus = _slice_for_cfaa(md_text)
+def _llm_extract(md_text: str, focus: Optional[str] = None) -> Dict[str, Optional[float | bool]]:
+    if focus is None:
+        focus = _slice_for_cfaa(md_text)
     payload = test_expert("This is the final answer you need to extract result from:\n" + focus)
 
     # Coerce to final types (float/None for pKa; bool/None for linreg)
@@ -221,13 +274,35 @@ def extract_pka_from_md(md_path: str) -> Dict[str, Optional[float | bool]]:
     """
     md_text = Path(md_path).read_text(encoding="utf-8", errors="ignore")
 
-    data = _regex_extract(md_text)
+    # Sectionize + alias scan once; both passes work on the same slice
+    focus = _slice_for_cfaa(md_text)
+    data = _regex_extract(md_text, focus)
 
-    # If anything missing, LLM fills the gaps
+    # If anything missing, LLM fills the gaps. The regex pass always settles
+    # has_linear_regression_model (True/False), so in practice only a missing
+    # pKa triggers the call.
     if any(v is None for v in data.values()):
-        llm_data = _llm_extract(md_text)
+        llm_data = _llm_extract(md_text, focus)
         for k, v in data.items():
             if v is None and llm_data.get(k) is not None:
                 data[k] = llm_data[k]
 
     return data
+
+def extract_pka_from_mds(
+    md_paths: Iterable[Union[str, Path]],
+    *,
+    max_workers: int = 4,
+) -> List[Dict[str, Optional[float | bool]]]:
+    """
+    Run `extract_pka_from_md` over many reports, in input order.
+
+    Reports whose regex pass leaves a gap need an LLM round-trip; those calls
+    overlap across up to `max_workers` threads (one reused agent per thread)
+    instead of running back to back.
+    """
+    paths = [str(p) for p in md_paths]
+    if max_workers <= 1 or len(paths) <= 1:
+        return [extract_pka_from_md(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(extract_pka_from_md, paths))
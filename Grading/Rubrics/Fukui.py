@@ -4,6 +4,7 @@ Rubric configuration for the Fukui Index benchmark job.
 Defines the scoring criteria for boolean checks (Input/Output validity)
 and numerical accuracy (Condensed Fukui Functions).
 """
+from .criteria import compile_criteria
 
 RUBRIC_FUKUI = {
     "metadata": {
@@ -136,4 +137,7 @@ RUBRIC_FUKUI = {
     },
 }
 
-RUBRIC = RUBRIC_FUKUI
\ No newline at end of file
+RUBRIC = RUBRIC_FUKUI
+
+# Typed, immutable view of the numerical criteria (compiled once at import)
+NUMERICAL_CRITERIA_FUKUI = compile_criteria(RUBRIC_FUKUI["numerical"]["criteria"])
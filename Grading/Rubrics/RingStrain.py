@@ -1,4 +1,5 @@
 # Auto_benchmark/Grading/Rubrics/RingStrain.py
+from .criteria import compile_abs_tol, compile_input_qc
 
 RUBRIC_RINGSTRAIN = {
     "metadata": {
@@ -81,3 +82,7 @@ RUBRIC_RINGSTRAIN = {
 
 # Back-compat export name used elsewhere in the codebase
 RUBRIC = RUBRIC_RINGSTRAIN
+
+# Typed, immutable views (compiled once at import)
+INPUT_QC_RINGSTRAIN = compile_input_qc(RUBRIC_RINGSTRAIN["boolean"]["sections"]["input_qc"])
+NUMERICAL_CONFIG_RINGSTRAIN = compile_abs_tol(RUBRIC_RINGSTRAIN["numerical"]["config"])
@@ -1,3 +1,5 @@
+from .criteria import compile_criteria
+
 RUBRIC_TDDFT = {
     # Boolean sections = 51 pts total
     "boolean": {
@@ -70,3 +72,6 @@ RUBRIC_TDDFT = {
     # overall
     "total_points": 100.0,
 }
+
+# Typed, immutable view of the numerical criteria (compiled once at import)
+NUMERICAL_CRITERIA_TDDFT = compile_criteria(RUBRIC_TDDFT["numerical"]["criteria"])
@@ -4,10 +4,24 @@ from .pKa import RUBRIC_PKA as PKA_RUBRIC
 from .TDDFT import RUBRIC_TDDFT as TDDFT_RUBRIC
 from .RingStrain import RUBRIC_RINGSTRAIN as RINGSTRAIN_RUBRIC
 from .Fukui import RUBRIC_FUKUI as FUKUI_RUBRIC
+from .criteria import (
+    NumericalCriterion,
+    compile_criteria,
+    InputQCSection,
+    compile_input_qc,
+    AbsTolConfig,
+    compile_abs_tol,
+)
 
 __all__ = [
     "PKA_RUBRIC",
     "TDDFT_RUBRIC",
     "RINGSTRAIN_RUBRIC",
-    "FUKUI_RUBRIC"
+    "FUKUI_RUBRIC",
+    "NumericalCriterion",
+    "compile_criteria",
+    "InputQCSection",
+    "compile_input_qc",
+    "AbsTolConfig",
+    "compile_abs_tol",
 ]
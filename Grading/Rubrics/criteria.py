@@ -0,0 +1,121 @@
+# Auto_benchmark/Grading/Rubrics/criteria.py
+"""
+Immutable, typed views of rubric blocks that scorers read on every call.
+
+The rubric dicts stay the editable source of truth; each rubric module
+compiles the relevant blocks once at import so scorers can read fixed,
+already-coerced attributes instead of re-hashing string keys (and re-running
+float() casts) per case.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from typing import Any, Dict, Tuple
+
+__all__ = [
+    "NumericalCriterion",
+    "compile_criteria",
+    "InputQCSection",
+    "compile_input_qc",
+    "AbsTolConfig",
+    "compile_abs_tol",
+]
+
+
+@dataclass(frozen=True, slots=True)
+class NumericalCriterion:
+    """One tiered relative-error metric (full credit ≤ full_rel, half ≤ half_rel)."""
+    name: str
+    weight: float
+    full_rel: float
+    half_rel: float
+    require_json_proof: bool = False
+
+
+def compile_criteria(criteria: Dict[str, Dict[str, Any]]) -> Tuple[NumericalCriterion, ...]:
+    """
+    Convert a rubric's `numerical.criteria` mapping into NumericalCriterion objects.
+
+    Args:
+        criteria: Mapping of metric name → {"weight", "full_rel", "half_rel", ...}.
+
+    Returns:
+        Tuple[NumericalCriterion, ...]: Criteria in rubric order.
+    """
+    return tuple(
+        NumericalCriterion(
+            name=name,
+            weight=float(cfg["weight"]),
+            full_rel=float(cfg["full_rel"]),
+            half_rel=float(cfg["half_rel"]),
+            require_json_proof=bool(cfg.get("require_json_proof", False)),
+        )
+        for name, cfg in criteria.items()
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class InputQCSection:
+    """Per-molecule QC checks: YES columns plus one imaginary-frequency column awarded on NO."""
+    columns: Tuple[str, ...]
+    yes_columns: Tuple[str, ...]
+    imag_column: str
+    yes_score: float
+    imag_no_score: float
+    max_points: float
+    weights: Tuple[float, ...]   # per-column points: yes_score ×7, then imag_no_score
+
+
+def compile_input_qc(section: Dict[str, Any]) -> InputQCSection:
+    """
+    Convert an `input_qc` section (8 columns; the 8th is the imag-freq check).
+
+    Args:
+        section: Mapping with "columns", "yes_score", "imag_no_score", "max_points".
+
+    Returns:
+        InputQCSection: The compiled section.
+    """
+    cols = tuple(section["columns"])
+    yes_score = float(section["yes_score"])
+    imag_no_score = float(section["imag_no_score"])
+    return InputQCSection(
+        columns=cols,
+        yes_columns=cols[:7],
+        imag_column=cols[7],
+        yes_score=yes_score,
+        imag_no_score=imag_no_score,
+        max_points=float(section["max_points"]),
+        weights=(yes_score,) * 7 + (imag_no_score,),
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class AbsTolConfig:
+    """Absolute-tolerance numerical block (RingStrain ΔH/ΔG)."""
+    ring_sizes: Tuple[int, ...]
+    key_h: str
+    key_g: str
+    tol_full: float
+    tol_half: float
+    per_item_points: float
+
+
+def compile_abs_tol(config: Dict[str, Any]) -> AbsTolConfig:
+    """
+    Convert a `numerical.config` block with absolute tolerances.
+
+    Args:
+        config: Mapping with "ring_sizes_for_scoring", "keys", "abs_tol_full",
+            "abs_tol_half" and "per_item_points".
+
+    Returns:
+        AbsTolConfig: The compiled config.
+    """
+    return AbsTolConfig(
+        ring_sizes=tuple(config["ring_sizes_for_scoring"]),
+        key_h=config["keys"]["delta_h"],
+        key_g=config["keys"]["delta_g"],
+        tol_full=float(config["abs_tol_full"]),
+        tol_half=float(config["abs_tol_half"]),
+        per_item_points=float(config["per_item_points"]),
+    )
@@ -1,4 +1,5 @@
 # Auto_benchmark/Grading/Rubrics/pKa.py
+from .criteria import compile_input_qc
 
 RUBRIC_PKA = {
     "metadata": {
@@ -66,3 +67,6 @@ RUBRIC_PKA = {
 
 # Back-compat export name used elsewhere in the codebase
 RUBRIC = RUBRIC_PKA
+
+# Typed, immutable view (compiled once at import)
+INPUT_QC_PKA = compile_input_qc(RUBRIC_PKA["boolean"]["sections"]["input_qc"])
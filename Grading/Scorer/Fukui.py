@@ -1,17 +1,42 @@
 from __future__ import annotations
-from typing import Dict, Any, Tuple, Union, List
+from typing import Dict, Any, Tuple, Union, List, Optional
+import numpy as np
 import pandas as pd
 
-from Auto_benchmark.Grading.Rubrics.Fukui import RUBRIC_FUKUI
+from Auto_benchmark.Grading.Rubrics.Fukui import RUBRIC_FUKUI, NUMERICAL_CRITERIA_FUKUI
+from Auto_benchmark.Grading.Rubrics.criteria import compile_criteria
 from Auto_benchmark.Grading import utils
+from Auto_benchmark.io.cache import BoundedCache
 
 __all__ = [
     "score_booleans_fukui",
     "score_numerical_fukui",
     "score_fukui_case",
+    "expand_atom_details",
+    "STATUS_LEGEND",
 ]
 
 # ---------------- Boolean scoring (60 pts) ----------------
+# Fuzzy column matches depend only on the row's keys, so they are memoized per
+# (header, rubric column); _NO_COLUMN records "find_column_fuzzy raised KeyError".
+_NO_COLUMN = object()
+_FUZZY_COL_CACHE = BoundedCache(1024)
+
+
+def _resolve_column(header: Tuple[str, ...], col: str) -> Any:
+    key = (header, col)
+    actual = _FUZZY_COL_CACHE.get(key)
+    if actual is not None:
+        return actual
+    try:
+        # find_column_fuzzy only looks at the column labels; an empty frame is enough
+        actual = utils.find_column_fuzzy(pd.DataFrame(columns=list(header)), col)
+    except KeyError:
+        actual = _NO_COLUMN
+    _FUZZY_COL_CACHE.put(key, actual)
+    return actual
+
+
 def score_booleans_fukui(
     booleans: Union[pd.DataFrame, Dict[str, Any]],
     *,
@@ -37,6 +62,7 @@ def score_booleans_fukui(
     if isinstance(booleans, pd.DataFrame):
         row = booleans.iloc[0].to_dict() if not booleans.empty else {}
 
+    header = tuple(row.keys())
     total_pts = 0.0
     details = {"sections": {}, "max": rubric["boolean"]["total"]}
     
@@ -50,18 +76,18 @@ def score_booleans_fukui(
         
         for col in columns:
             # Use utility for fuzzy column lookup (handles case/whitespace)
-            try:
-                actual_col = utils.find_column_fuzzy(pd.DataFrame([row]), col)
-                val = row.get(actual_col)
-                
-                # Use utility for robust boolean check
-                if utils.is_yes(val):
-                    sec_earned += yes_score
-                    row_details[col] = "pass"
-                else:
-                    row_details[col] = "fail"
-            except KeyError:
+            actual_col = _resolve_column(header, col)
+            if actual_col is _NO_COLUMN:
                 row_details[col] = "missing"
+                continue
+            val = row.get(actual_col)
+
+            # Use utility for robust boolean check
+            if utils.is_yes(val):
+                sec_earned += yes_score
+                row_details[col] = "pass"
+            else:
+                row_details[col] = "fail"
 
         # Cap points at section max
         sec_earned = min(sec_earned, max_sec_pts)
@@ -77,11 +103,128 @@ def score_booleans_fukui(
 
 
 # ---------------- Numerical scoring (40 pts) ----------------
+def _is_real_list(values: List[Any]) -> bool:
+    return all(isinstance(v, (int, float)) and not isinstance(v, bool) for v in values)
+
+
+def _score_atoms_np(
+    gt_list: List[float],
+    ag_list: List[float],
+    pts_per_atom: float,
+    full_tol: float,
+    half_tol: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Vectorized per-atom tiers for all-numeric lists.
+
+    rel = |agent - gt| / |gt| where gt != 0; atoms with gt == 0 fall back to the
+    absolute check (|agent - gt| < 1e-3 → full), as in the per-atom loop.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: (rel (NaN where undefined), points, tier codes)
+        with tier codes 0=fail, 1=full, 2=half, 3=out_of_tol, 4=full (abs).
+    """
+    g = np.asarray(gt_list, dtype=np.float64)
+    a = np.asarray(ag_list, dtype=np.float64)
+    diff = np.abs(a - g)
+    denom = np.abs(g)
+    has_rel = denom > 0.0
+    rel = np.divide(diff, denom, out=np.full_like(diff, np.nan), where=has_rel)
+
+    full = has_rel & (rel <= full_tol)
+    half = has_rel & ~full & (rel <= half_tol)
+    abs_full = ~has_rel & (diff < 1e-3)
+    pts = np.select([full | abs_full, half], [pts_per_atom, 0.5 * pts_per_atom], 0.0)
+    tier = np.select([full, half, has_rel, abs_full], [1, 2, 3, 4], 0)
+    return rel, pts, tier
+
+
+# Per-atom status codes used in the compact "atoms" columns; emitted once per
+# details dict as "status_legend". out_of_tol keeps its rel error in "rel".
+STATUS_LEGEND = {0: "fail", 1: "full", 2: "half", 3: "out_of_tol", 4: "full (abs)"}
+
+
+def _status_label(tier: int, rel: Optional[float]) -> str:
+    return f"out_of_tol ({rel:.2f})" if tier == 3 else STATUS_LEGEND[tier]
+
+
+def _score_atoms_vectorized(
+    gt_list: List[float],
+    ag_list: List[float],
+    pts_per_atom: float,
+    full_tol: float,
+    half_tol: float,
+) -> Tuple[float, List[Optional[float]], List[float], List[int]]:
+    """Per-atom scoring for all-numeric lists via `_score_atoms_np`."""
+    rel_arr, pts_arr, tier_arr = _score_atoms_np(gt_list, ag_list, pts_per_atom, full_tol, half_tol)
+    rels = [None if r != r else r for r in rel_arr.tolist()]  # NaN → None
+    return float(pts_arr.sum()), rels, pts_arr.tolist(), tier_arr.tolist()
+
+
+def _score_atoms_loop(
+    gt_list: List[Any],
+    ag_list: List[Any],
+    pts_per_atom: float,
+    full_tol: float,
+    half_tol: float,
+) -> Tuple[float, List[Optional[float]], List[float], List[int]]:
+    """Per-atom scoring through the utils helpers (handles None/str entries)."""
+    metric_earned = 0.0
+    rels: List[Optional[float]] = []
+    pts: List[float] = []
+    tiers: List[int] = []
+    for g_val, a_val in zip(gt_list, ag_list):
+        # Use utility for error calculation
+        rel = utils.rel_error(g_val, a_val)
+
+        p = 0.0
+        tier = 0
+
+        if rel is not None:
+            if rel <= full_tol:
+                p = pts_per_atom
+                tier = 1
+            elif rel <= half_tol:
+                p = pts_per_atom * 0.5
+                tier = 2
+            else:
+                tier = 3
+        else:
+            # Handle near-zero GT where rel_error is None
+            ae = utils.abs_error(g_val, a_val)
+            if ae is not None and ae < 1e-3:
+                p = pts_per_atom
+                tier = 4
+
+        metric_earned += p
+        rels.append(rel)
+        pts.append(p)
+        tiers.append(tier)
+    return metric_earned, rels, pts, tiers
+
+
+def expand_atom_details(atoms: Union[Dict[str, List[Any]], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """
+    Turn the compact per-atom columns of a metric ("atoms" with "status_codes",
+    "pts", "rel") into the verbose [{"idx", "status", "pts"}, ...] form.
+    Already-verbose lists are returned unchanged.
+
+    Status codes: see STATUS_LEGEND.
+    """
+    if isinstance(atoms, list):
+        return atoms
+    return [
+        {"idx": i, "status": _status_label(t, r), "pts": p}
+        for i, (t, p, r) in enumerate(zip(atoms["status_codes"], atoms["pts"], atoms["rel"]))
+    ]
+
+
 def score_numerical_fukui(
     ground_truth: Dict[str, Any],
     agent: Dict[str, Any],
     *,
     rubric: Dict = RUBRIC_FUKUI,
+    verbose: bool = False,
 ) -> Tuple[float, Dict[str, Any]]:
     """
     Scores the Condensed Fukui Indices.
@@ -93,18 +236,26 @@ def score_numerical_fukui(
         ground_truth: Calculated GT values.
         agent: Extracted agent values.
         rubric: The rubric configuration.
+        verbose: Report each metric's "atoms" as a list of per-atom dicts instead of
+            the compact {"status_codes", "pts", "rel"} columns (see `expand_atom_details`).
 
     Returns:
         Tuple[float, Dict[str, Any]]: (Total points, Detailed breakdown).
     """
-    criteria = rubric["numerical"]["criteria"]
+    criteria = (
+        NUMERICAL_CRITERIA_FUKUI if rubric is RUBRIC_FUKUI
+        else compile_criteria(rubric["numerical"]["criteria"])
+    )
     total_pts = 0.0
     details = {"metrics": {}, "max": rubric["numerical"]["total"]}
+    if not verbose:
+        details["status_legend"] = STATUS_LEGEND
 
-    for metric_name, cfg in criteria.items():
-        weight = cfg["weight"]
-        full_tol = cfg["full_rel"]
-        half_tol = cfg["half_rel"]
+    for crit in criteria:
+        metric_name = crit.name
+        weight = crit.weight
+        full_tol = crit.full_rel
+        half_tol = crit.half_rel
         
         gt_list = ground_truth.get(metric_name)
         ag_list = agent.get(metric_name)
@@ -118,40 +269,24 @@ def score_numerical_fukui(
         if n_atoms == 0: continue
             
         pts_per_atom = weight / n_atoms
-        metric_earned = 0.0
-        atom_details = []
-        
-        for i, (g_val, a_val) in enumerate(zip(gt_list, ag_list)):
-            # Use utility for error calculation
-            rel = utils.rel_error(g_val, a_val)
-            
-            p = 0.0
-            status = "fail"
-            
-            if rel is not None:
-                if rel <= full_tol:
-                    p = pts_per_atom
-                    status = "full"
-                elif rel <= half_tol:
-                    p = pts_per_atom * 0.5
-                    status = "half"
-                else:
-                    status = f"out_of_tol ({rel:.2f})"
-            else:
-                # Handle near-zero GT where rel_error is None
-                ae = utils.abs_error(g_val, a_val)
-                if ae is not None and ae < 1e-3:
-                    p = pts_per_atom
-                    status = "full (abs)"
-
-            metric_earned += p
-            atom_details.append({"idx": i, "status": status, "pts": round(p, 4)})
-            
+        if _is_real_list(gt_list) and _is_real_list(ag_list):
+            metric_earned, rels, pts, tiers = _score_atoms_vectorized(
+                gt_list, ag_list, pts_per_atom, full_tol, half_tol
+            )
+        else:
+            # None/strings present: per-atom utility calls
+            metric_earned, rels, pts, tiers = _score_atoms_loop(
+                gt_list, ag_list, pts_per_atom, full_tol, half_tol
+            )
+        atom_details = {"status_codes": tiers, "pts": pts, "rel": rels}
+        if verbose:
+            atom_details = expand_atom_details(atom_details)
+
         metric_earned = min(metric_earned, weight)
         total_pts += metric_earned
         
         details["metrics"][metric_name] = {
-            "points": round(metric_earned, 2),
+            "points": metric_earned,
             "max": weight,
             "atoms": atom_details
         }
@@ -166,6 +301,7 @@ def score_fukui_case(
     agent_numeric: Dict[str, Any],
     *,
     rubric: Dict = RUBRIC_FUKUI,
+    verbose: bool = False,
 ) -> Dict[str, Any]:
     """
     Unified per-case scoring for Fukui.
@@ -175,12 +311,13 @@ def score_fukui_case(
         gt_numeric: Calculated Ground Truth.
         agent_numeric: Extracted Agent values.
         rubric: Rubric dictionary.
+        verbose: Per-atom dicts in the numerical details (see `score_numerical_fukui`).
         
     Returns:
         Dict[str, Any]: Final scoring payload.
     """
     b_pts, b_det = score_booleans_fukui(booleans, rubric=rubric)
-    n_pts, n_det = score_numerical_fukui(gt_numeric, agent_numeric, rubric=rubric)
+    n_pts, n_det = score_numerical_fukui(gt_numeric, agent_numeric, rubric=rubric, verbose=verbose)
     
     total = round(b_pts + n_pts, 3)
     
@@ -2,9 +2,15 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional, Iterable, Union
 import re
+import numpy as np
 import pandas as pd
 
-from Auto_benchmark.Grading.Rubrics.RingStrain import RUBRIC_RINGSTRAIN
+from Auto_benchmark.Grading.Rubrics.RingStrain import (
+    RUBRIC_RINGSTRAIN,
+    INPUT_QC_RINGSTRAIN,
+    NUMERICAL_CONFIG_RINGSTRAIN,
+)
+from Auto_benchmark.Grading.Rubrics.criteria import compile_abs_tol, compile_input_qc
 from Auto_benchmark.io import fs
 
 __all__ = [
@@ -26,25 +32,23 @@ def score_booleans_ringstrain(
       - 11 molecules total × 8 × 0.5 = 44 max
     `booleans` can be a CSV Path or a pandas DataFrame.
     """
-    df = pd.read_csv(booleans) if isinstance(booleans, Path) else booleans.copy()
+    df = fs.read_csv_cached(booleans) if isinstance(booleans, Path) else booleans  # read-only below
     sec = rubric["boolean"]["sections"]["input_qc"]
+    qc = INPUT_QC_RINGSTRAIN if rubric is RUBRIC_RINGSTRAIN else compile_input_qc(sec)
     details = {"sections": {}, "max": rubric["boolean"]["total"]}
 
-    cols = [ fs._find_column(df, c) for c in sec["columns"] ]
+    cols = fs._find_columns(df, qc.columns)
     yes_cols = cols[:7]
     imag_col = cols[7]
 
-    sec_pts = 0.0
-    per_row = []
-    for _, row in df.iterrows():
-        pts = 0.0
-        pts += sum(sec["yes_score"] for c in yes_cols if fs._is_yes(row.get(c)))
-        pts += sec["imag_no_score"] if fs._is_no(row.get(imag_col)) else 0.0
-        per_row.append(pts)
-        sec_pts += pts
+    # (rows, 8) pass matrix — 7 YES checks, then imag freq == NO — dotted with
+    # the compiled per-column points
+    passed = np.column_stack([fs._yes_matrix(df, yes_cols), fs._is_no_vec(df, imag_col)])
+    per_row = (passed @ np.asarray(qc.weights)).tolist()
+    sec_pts = float(sum(per_row))
 
     # cap to max (handles if df has > 11 rows)
-    sec_pts = min(sec_pts, sec["max_points"])
+    sec_pts = min(sec_pts, qc.max_points)
     details["sections"]["input_qc"] = {
         "points": sec_pts,
         "max": sec["max_points"],
@@ -74,11 +78,22 @@ def score_reference_ringstrain(
     return pts, details
 
 # ---------------- Numerical scoring (48 pts) ----------------
+def _as_float(x: Any) -> float:
+    """Value → float, with None / non-numeric mapped to NaN (treated as missing)."""
+    if x is None:
+        return np.nan
+    try:
+        return float(x)
+    except (TypeError, ValueError):
+        return np.nan
+
+
 def score_numerical_ringstrain(
     ground_truth_rows: Dict[int, Dict[str, Optional[float]]],
     agent_rows: Dict[int, Dict[str, Optional[float]]],
     *,
     rubric: Dict = RUBRIC_RINGSTRAIN,
+    with_items: bool = True,
 ) -> Tuple[float, Dict[str, Any]]:
     """
     Score ΔH and ΔG (kcal/mol) for ring sizes listed in the rubric.
@@ -89,65 +104,50 @@ def score_numerical_ringstrain(
         half if abs_tol_full < |err| ≤ abs_tol_half
         else 0
     Each item worth 4.0 points (12 items → 48 total).
+    All items are scored in one vectorized pass; pass with_items=False to skip
+    building the per-item "items" list when only the total is needed.
     """
-    cfg = rubric["numerical"]["config"]
-    sizes: Iterable[int] = cfg["ring_sizes_for_scoring"]
-    key_h = cfg["keys"]["delta_h"]
-    key_g = cfg["keys"]["delta_g"]
-    tol_full = float(cfg["abs_tol_full"])
-    tol_half = float(cfg["abs_tol_half"])
-    per_pts  = float(cfg["per_item_points"])
-
-    total = 0.0
-    per_item_details = []
+    cfg = (
+        NUMERICAL_CONFIG_RINGSTRAIN if rubric is RUBRIC_RINGSTRAIN
+        else compile_abs_tol(rubric["numerical"]["config"])
+    )
+    sizes = list(cfg.ring_sizes)
+    key_h = cfg.key_h
+    key_g = cfg.key_g
+    tol_full = cfg.tol_full
+    tol_half = cfg.tol_half
+    per_pts  = cfg.per_item_points
+
+    keys = (key_h, key_g)
+    gt_rows = [ground_truth_rows.get(n, {}) for n in sizes]
+    ag_rows = [agent_rows.get(n, {}) for n in sizes]
+
+    # (N, 2) matrices: one row per ring size, columns ΔH / ΔG; missing → NaN
+    gt_mat = np.array([[_as_float(r.get(k)) for k in keys] for r in gt_rows], dtype=float).reshape(-1, 2)
+    ag_mat = np.array([[_as_float(r.get(k)) for k in keys] for r in ag_rows], dtype=float).reshape(-1, 2)
+
+    err = np.abs(ag_mat - gt_mat)
+    missing = np.isnan(err)
+    full = err <= tol_full                     # NaN compares False
+    half = ~full & (err <= tol_half)
+    pts = full * per_pts + half * (0.5 * per_pts)
+    total = float(pts.sum())
 
-    def _score_one(name: str, gt: Optional[float], pred: Optional[float]) -> Tuple[float, str, Optional[float]]:
-        err = fs._abs_err(gt, pred)
-        if err is None:
-            return 0.0, "missing", None
-        if err <= tol_full:
-            return per_pts, "full", err
-        if err <= tol_half:
-            return 0.5 * per_pts, "half", err
-        return 0.0, "out_of_range", err
-
-    for n in sizes:
-        gt_row = ground_truth_rows.get(n, {})
-        ag_row = agent_rows.get(n, {})
-
-        # ΔH
-        pts_h, reason_h, err_h = _score_one(
-            f"{n}:{key_h}",
-            gt_row.get(key_h),
-            ag_row.get(key_h),
-        )
-        total += pts_h
-        per_item_details.append({
-            "ring_size": n,
-            "metric": key_h,
-            "gt": gt_row.get(key_h),
-            "pred": ag_row.get(key_h),
-            "abs_err": err_h,
-            "points": pts_h,
-            "reason": reason_h,
-        })
-
-        # ΔG
-        pts_g, reason_g, err_g = _score_one(
-            f"{n}:{key_g}",
-            gt_row.get(key_g),
-            ag_row.get(key_g),
-        )
-        total += pts_g
-        per_item_details.append({
-            "ring_size": n,
-            "metric": key_g,
-            "gt": gt_row.get(key_g),
-            "pred": ag_row.get(key_g),
-            "abs_err": err_g,
-            "points": pts_g,
-            "reason": reason_g,
-        })
+    per_item_details = []
+    if with_items:
+        reasons = np.where(full, "full", np.where(half, "half", "out_of_range"))
+        for i, n in enumerate(sizes):
+            for j, key in enumerate(keys):
+                miss = bool(missing[i, j])
+                per_item_details.append({
+                    "ring_size": n,
+                    "metric": key,
+                    "gt": gt_rows[i].get(key),
+                    "pred": ag_rows[i].get(key),
+                    "abs_err": None if miss else float(err[i, j]),
+                    "points": float(pts[i, j]),
+                    "reason": "missing" if miss else str(reasons[i, j]),
+                })
 
     # cap to rubric max (48)
     total = min(total, rubric["numerical"]["total"])
@@ -157,7 +157,7 @@ def score_numerical_ringstrain(
         "abs_tol_full": tol_full,
         "abs_tol_half": tol_half,
         "per_item_points": per_pts,
-        "ring_sizes": list(sizes),
+        "ring_sizes": sizes,
         "keys": {"delta_h": key_h, "delta_g": key_g},
     }
     return total, details
@@ -3,9 +3,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Dict, Any, Tuple, Optional, Iterable, Union
 import re
+import numpy as np
 import pandas as pd
 
-from Auto_benchmark.Grading.Rubrics.TDDFT import RUBRIC_TDDFT
+from Auto_benchmark.Grading.Rubrics.TDDFT import RUBRIC_TDDFT, NUMERICAL_CRITERIA_TDDFT
+from Auto_benchmark.Grading.Rubrics.criteria import compile_criteria
 from Auto_benchmark.io import fs
 
 __all__ = [
@@ -25,59 +27,60 @@ def score_booleans_tddft(
     `booleans` can be a CSV Path or a pandas DataFrame.
     Returns (points, details).
     """
-    df = pd.read_csv(booleans) if isinstance(booleans, Path) else booleans.copy()
+    df = fs.read_csv_cached(booleans) if isinstance(booleans, Path) else booleans  # read-only below
     details = {"sections": {}, "max": rubric["boolean"]["total"]}
     total_pts = 0.0
 
+    b = rubric["boolean"]
+    s_inp, s_scf, s_opt, s_td = b["input"], b["common_output"], b["opt_output"], b["tddft_output"]
+
+    # Resolve every column once and evaluate all YES checks in a single matrix;
+    # the sections below only slice it.
+    n_inp = len(s_inp["columns"])
+    yes_cols = fs._find_columns(
+        df, [*s_inp["columns"], s_scf["columns"][0], s_opt["columns_yes"][0], *s_td["columns"]]
+    )
+    imag_col = fs._find_columns(df, [s_opt["columns_no"][0]])[0]
+    yes_mat = fs._yes_matrix(df, yes_cols)
+    inp_yes = yes_mat[:, :n_inp]
+    scf_yes = yes_mat[:, n_inp].astype(bool)
+    geo_yes = yes_mat[:, n_inp + 1].astype(bool)
+    td_yes  = yes_mat[:, n_inp + 2:]
+    imag_no = fs._is_no_vec(df, imag_col)
+
     # 1) Input checks (×2 inputs)
-    sec = rubric["boolean"]["input"]
-    inp_cols = [ fs._find_column(df, c) for c in sec["columns"] ]
-    sec_pts = 0.0; per_row = []
-    for _, row in df.iterrows():
-        row_pts = sum(sec["yes_score"] for c in inp_cols if fs._is_yes(row.get(c)))
-        per_row.append(row_pts)
-        sec_pts += row_pts
+    sec = s_inp
+    per_row = (sec["yes_score"] * np.count_nonzero(inp_yes, axis=1)).tolist()
+    sec_pts = float(sum(per_row))
     sec_pts *= sec.get("multiplicity", 1)
     sec_pts = min(sec_pts, sec["max_points"])
     total_pts += sec_pts
     details["sections"]["input"] = {"points": sec_pts, "max": sec["max_points"], "per_row": per_row}
 
     # 2) Common output (SCF ×2)
-    sec = rubric["boolean"]["common_output"]
-    scf_col = fs._find_column(df, sec["columns"][0])
-    sec_pts = 0.0; per_row = []
-    for _, row in df.iterrows():
-        pts = sec["yes_score"] if fs._is_yes(row.get(scf_col)) else 0.0
-        per_row.append(pts)
-        sec_pts += pts
+    sec = s_scf
+    per_row = np.where(scf_yes, sec["yes_score"], 0.0).tolist()
+    sec_pts = float(sum(per_row))
     sec_pts *= sec.get("multiplicity", 1)
     sec_pts = min(sec_pts, sec["max_points"])
     total_pts += sec_pts
     details["sections"]["common_output"] = {"points": sec_pts, "max": sec["max_points"], "per_row": per_row}
 
     # 3) Optimization output (Geo opt + Imag freq==no)
-    sec = rubric["boolean"]["opt_output"]
-    geo_col  = fs._find_column(df, sec["columns_yes"][0])
-    imag_col = fs._find_column(df, sec["columns_no"][0])
-    sec_pts = 0.0; per_row = []
-    for _, row in df.iterrows():
-        pts = 0.0
-        pts += sec["yes_score"] if fs._is_yes(row.get(geo_col)) else 0.0
-        pts += sec["no_score"]  if fs._is_no(row.get(imag_col)) else 0.0
-        per_row.append(pts)
-        sec_pts += pts
+    sec = s_opt
+    per_row = (
+        np.where(geo_yes, sec["yes_score"], 0.0)
+        + np.where(imag_no, sec["no_score"], 0.0)
+    ).tolist()
+    sec_pts = float(sum(per_row))
     sec_pts = min(sec_pts, sec["max_points"])
     total_pts += sec_pts
     details["sections"]["opt_output"] = {"points": sec_pts, "max": sec["max_points"], "per_row": per_row}
 
     # 4) TDDFT block / energy / oscillator
-    sec = rubric["boolean"]["tddft_output"]
-    tddft_cols = [ fs._find_column(df, c) for c in sec["columns"] ]
-    sec_pts = 0.0; per_row = []
-    for _, row in df.iterrows():
-        pts = sum(sec["yes_score"] for c in tddft_cols if fs._is_yes(row.get(c)))
-        per_row.append(pts)
-        sec_pts += pts
+    sec = s_td
+    per_row = (sec["yes_score"] * np.count_nonzero(td_yes, axis=1)).tolist()
+    sec_pts = float(sum(per_row))
     sec_pts = min(sec_pts, sec["max_points"])
     total_pts += sec_pts
     details["sections"]["tddft_output"] = {"points": sec_pts, "max": sec["max_points"], "per_row": per_row}
@@ -97,17 +100,21 @@ def score_numerical_tddft(
     using ±10%/±20% tiers from the rubric. If a metric requires JSON proof and
     `json_proof` is False, award 0 for that metric.
     """
-    crits = rubric["numerical"]["criteria"]
+    crits = (
+        NUMERICAL_CRITERIA_TDDFT if rubric is RUBRIC_TDDFT
+        else compile_criteria(rubric["numerical"]["criteria"])
+    )
     total = 0.0
     details = {"metrics": {}, "max": rubric["numerical"]["total"]}
 
-    for name, cfg in crits.items():
+    for c in crits:
+        name = c.name
         gt   = ground_truth.get(name)
         pred = agent.get(name)
         rel  = fs._rel_err(gt, pred)
-        w    = cfg["weight"]
+        w    = c.weight
 
-        if cfg.get("require_json_proof", False) and not json_proof:
+        if c.require_json_proof and not json_proof:
             details["metrics"][name] = {"points": 0.0, "gt": gt, "pred": pred, "rel_err": rel, "reason": "no_json_proof"}
             continue
 
@@ -115,9 +122,9 @@ def score_numerical_tddft(
             details["metrics"][name] = {"points": 0.0, "gt": gt, "pred": pred, "rel_err": rel, "reason": "missing"}
             continue
 
-        if rel <= cfg["full_rel"]:
+        if rel <= c.full_rel:
             pts, reason = w, "full"
-        elif rel <= cfg["half_rel"]:
+        elif rel <= c.half_rel:
             pts, reason = 0.5 * w, "half"
         else:
             pts, reason = 0.0, "out_of_range"
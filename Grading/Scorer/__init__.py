@@ -12,7 +12,7 @@ from .RingStrain import (
     score_numerical_ringstrain,
     score_ringstrain,
 )
-from .Fukui import score_fukui_case
+from .Fukui import score_fukui_case, expand_atom_details
 
 __all__ = [
     # pKa
@@ -31,4 +31,5 @@ __all__ = [
     
     # Fukui
     "score_fukui_case",
+    "expand_atom_details",
 ]
@@ -2,27 +2,64 @@
 from __future__ import annotations
 from typing import Dict, Any, Optional, List, Union
 import re
+import numpy as np
+import pandas as pd
 
 from Auto_benchmark.Grading.Rubrics import PKA_RUBRIC as RUBRIC
+from Auto_benchmark.Grading.Rubrics.pKa import INPUT_QC_PKA
 from Auto_benchmark.Config import defaults
 from Auto_benchmark.io import fs
 
 __all__ = [
     "score_boolean_pka",
     "score_numerical_pka",
+    "score_numerical_pka_batch",
     "score_pka_case",
 ]
 
+# ---------------- rubric constants ----------------
+# This scorer always reads the module RUBRIC, so every value it needs is
+# resolved (with the historical defaults) and coerced once at import.
+_BCFG = RUBRIC.get("boolean", {}) or {}
+_DCFG = (_BCFG.get("sections", {}) or {}).get("delta_g", {}) or {}
+_DG_N_ITEMS = int(_DCFG.get("n_items", 8))
+_DG_PER_YES = float(_DCFG.get("per_yes", 1.5))
+_DG_MAX = float(_DCFG.get("max_points", 12.0))
+_BOOLEAN_TOTAL = float(_BCFG.get("total", 76.0))
+
+_NCFG = RUBRIC.get("numerical", {}) or {}
+_NCRIT = _NCFG.get("criteria", {}) or {}
+_NUMERICAL_TOTAL = float(_NCFG.get("total", 24.0))
+_LIN_PTS = float((_NCRIT.get("linear_regression", {}) or {}).get("weight", 12.0))
+_PKA_CFG = _NCRIT.get("pka_value", {}) or {}
+_FULL_WIN = _PKA_CFG.get("full", {"min": 1.4, "max": 1.6, "award": 12.0})
+_HALF_WIN = _PKA_CFG.get("half", {"min": 1.2, "max": 1.8, "award": 6.0})
+_FULL_MIN, _FULL_MAX, _FULL_AWARD = float(_FULL_WIN["min"]), float(_FULL_WIN["max"]), float(_FULL_WIN["award"])
+_HALF_MIN, _HALF_MAX, _HALF_AWARD = float(_HALF_WIN["min"]), float(_HALF_WIN["max"]), float(_HALF_WIN["award"])
+_TOTAL_MAX = float(RUBRIC.get("metadata", {}).get("total_max_points", 100.0))
+
+# input_qc tables shorter than this are scored with the plain per-row loop
+_VEC_MIN_ROWS = 3
+
 # ---------------- helpers ----------------
 def _coerce_float(x: Any) -> Optional[float]:
-    if x is None or (isinstance(x, str) and fs._norm_str(x) in {"", "none", "null", "do not exist", "n/a", "na"}):
+    if x is None or (isinstance(x, str) and fs._norm_str(x) in fs._NULLS):
         return None
     if isinstance(x, (int, float)) and not isinstance(x, bool):
         try:
             return float(x)
         except Exception:
             return None
-    m = defaults.NUM.search(str(x))
+    s = x.strip() if isinstance(x, str) else str(x)
+    # Fast path for clean numeric strings ("1.52", "-3e-2"). The shape checks keep
+    # it to inputs where float() and the NUM regex agree (no ".5", "1.e3", "1_0", "nan").
+    if s and (s[0].isdigit() or (s[0] in "+-" and s[1:2].isdigit())) and s[-1].isdigit() \
+            and "_" not in s and ".e" not in s and ".E" not in s:
+        try:
+            return float(s)
+        except ValueError:
+            pass
+    m = defaults.NUM.search(s)
     if not m:
         return None
     try:
@@ -41,35 +78,34 @@ def score_boolean_pka(
     delta_g_items: Optional[List[Union[bool, Dict[str, Any], str]]],
     delta_g_key: str = "deltaG_exist",
 ) -> tuple[float, dict]:
-    bcfg = RUBRIC.get("boolean", {}) or {}
-    sections = bcfg.get("sections", {}) or {}
-
     # ---- input_qc ----
-    icfg = sections.get("input_qc", {}) or {}
-    cols       = icfg.get("columns", [
-        "Method exist?","Basis set exist?","Tasks exist?","Charge & mult exist?",
-        "XYZ file exist?","SCF converged?","Geo opt converged?","Imag freq exist?",
-    ])
-    yes_score  = float(icfg.get("yes_score", 1.0))
-    imag_score = float(icfg.get("imag_no_score", 1.0))
-    icfg_max   = float(icfg.get("max_points", 64.0))
-
-    input_pts = 0.0
+    qc = INPUT_QC_PKA
+    cols       = list(qc.columns)
+    yes_score  = qc.yes_score
+    imag_score = qc.imag_no_score
+    icfg_max   = qc.max_points
+
     per_row_points: List[float] = []
-    for r in input_qc_rows:
-        rp = 0.0
-        for c in cols[:7]:
-            rp += yes_score if fs._is_yes(r.get(c)) else 0.0
-        rp += imag_score if fs._is_no(r.get(cols[7])) else 0.0
-        per_row_points.append(rp)
-        input_pts += rp
+    if len(input_qc_rows) < _VEC_MIN_ROWS:
+        # DataFrame construction would dominate for a couple of rows
+        n_yes_cols = len(qc.yes_columns)
+        for r in input_qc_rows:
+            yes = np.fromiter((fs._is_yes(r.get(c)) for c in qc.yes_columns), dtype=bool, count=n_yes_cols)
+            rp = yes_score * np.count_nonzero(yes)
+            rp += imag_score if fs._is_no(r.get(qc.imag_column)) else 0.0
+            per_row_points.append(float(rp))
+    else:
+        # dtype=object keeps cell values as given (no int → float upcasting)
+        df = pd.DataFrame(input_qc_rows, dtype=object)
+        passed = np.column_stack([fs._yes_matrix(df, qc.yes_columns), fs._is_no_vec(df, qc.imag_column)])
+        per_row_points = (passed @ np.asarray(qc.weights)).tolist()
+    input_pts = float(sum(per_row_points))
     # no extra cap here; upstream you typically have exactly 8 rows
 
     # ---- delta_g ----
-    dcfg = sections.get("delta_g", {}) or {}
-    n_items    = int(dcfg.get("n_items", 8))
-    per_yes    = float(dcfg.get("per_yes", 1.5))
-    dcfg_max   = float(dcfg.get("max_points", 12.0))
+    n_items    = _DG_N_ITEMS
+    per_yes    = _DG_PER_YES
+    dcfg_max   = _DG_MAX
 
     if not delta_g_items:
         dg_pts = 0.0
@@ -77,11 +113,12 @@ def score_boolean_pka(
         yes_capped = 0
         rows_seen = 0
     else:
-        yes_count = 0
-        for item in delta_g_items:
-            flag_val = item.get(delta_g_key) if isinstance(item, dict) else item
-            if fs._is_yes(flag_val):
-                yes_count += 1
+        flags = np.fromiter(
+            (fs._is_yes(item.get(delta_g_key) if isinstance(item, dict) else item) for item in delta_g_items),
+            dtype=bool,
+            count=len(delta_g_items),
+        )
+        yes_count = int(np.count_nonzero(flags))
         yes_capped = min(yes_count, n_items)
         dg_pts = min(yes_capped * per_yes, dcfg_max)
         rows_seen = len(delta_g_items)
@@ -93,7 +130,7 @@ def score_boolean_pka(
             "max": dcfg_max,
         }
 
-    boolean_total_cfg = float(bcfg.get("total", 76.0))
+    boolean_total_cfg = _BOOLEAN_TOTAL
     total_pts = input_pts + dg_pts
     # (do not cap across subsections unless you really want to enforce exact 76.0)
 
@@ -118,16 +155,8 @@ def score_boolean_pka(
 #   - pKa windowing: full (12) / half (6)
 # ==========================================================
 def score_numerical_pka(md_extraction: Dict[str, Any]) -> tuple[float, dict]:
-    ncfg = RUBRIC.get("numerical", {}) or {}
-    crit = ncfg.get("criteria", {}) or {}
-    max_total = float(ncfg.get("total", 24.0))
-
-    lin_cfg  = crit.get("linear_regression", {}) or {}
-    lin_pts  = float(lin_cfg.get("weight", 12.0))
-
-    pka_cfg  = crit.get("pka_value", {}) or {}
-    full_win = pka_cfg.get("full", {"min": 1.4, "max": 1.6, "award": 12.0})
-    half_win = pka_cfg.get("half", {"min": 1.2, "max": 1.8, "award": 6.0})
+    max_total = _NUMERICAL_TOTAL
+    lin_pts   = _LIN_PTS
 
     pts = 0.0
     details: Dict[str, Any] = {}
@@ -142,12 +171,12 @@ def score_numerical_pka(md_extraction: Dict[str, Any]) -> tuple[float, dict]:
     pka_val = _coerce_float(md_extraction.get("pKa_of_chlorofluoroacetic_acid"))
     details["pka_extracted"] = pka_val
     if pka_val is not None:
-        if float(full_win["min"]) <= pka_val <= float(full_win["max"]):
-            pts += float(full_win["award"])
-            details["pka_points"] = float(full_win["award"])
-        elif float(half_win["min"]) <= pka_val <= float(half_win["max"]):
-            pts += float(half_win["award"])
-            details["pka_points"] = float(half_win["award"])
+        if _FULL_MIN <= pka_val <= _FULL_MAX:
+            pts += _FULL_AWARD
+            details["pka_points"] = _FULL_AWARD
+        elif _HALF_MIN <= pka_val <= _HALF_MAX:
+            pts += _HALF_AWARD
+            details["pka_points"] = _HALF_AWARD
         else:
             details["pka_points"] = 0.0
     else:
@@ -156,6 +185,29 @@ def score_numerical_pka(md_extraction: Dict[str, Any]) -> tuple[float, dict]:
     details["max"] = max_total
     return pts, details
 
+def score_numerical_pka_batch(md_extractions: Union[pd.DataFrame, List[Dict[str, Any]]]) -> np.ndarray:
+    """
+    Numerical points for many cases at once (parameter sweeps, re-scoring runs).
+
+    Same rules as `score_numerical_pka`, evaluated as column operations over a
+    table with one row per case and the md-extraction keys as columns. Only the
+    points are returned; use `score_numerical_pka` for per-case details.
+    """
+    df = md_extractions if isinstance(md_extractions, pd.DataFrame) else pd.DataFrame(md_extractions, dtype=object)
+    n = len(df)
+    if "has_linear_regression_model" in df.columns:
+        lin_ok = df["has_linear_regression_model"].map(fs._is_yes).to_numpy(dtype=bool)
+    else:
+        lin_ok = np.zeros(n, dtype=bool)
+    if "pKa_of_chlorofluoroacetic_acid" in df.columns:
+        pka = df["pKa_of_chlorofluoroacetic_acid"].map(_coerce_float).to_numpy(dtype=float, na_value=np.nan)
+    else:
+        pka = np.full(n, np.nan)
+
+    full = (pka >= _FULL_MIN) & (pka <= _FULL_MAX)          # NaN compares False
+    half = ~full & (pka >= _HALF_MIN) & (pka <= _HALF_MAX)
+    return lin_ok * _LIN_PTS + full * _FULL_AWARD + half * _HALF_AWARD
+
 # ==========================================================
 # Unified 2-section scorer
 # ==========================================================
@@ -179,8 +231,8 @@ def score_pka_case(
         "numerical_details": numerical_details,
         "total_points": total,
         "rubric_max": {
-            "boolean_total": float(RUBRIC.get("boolean", {}).get("total", 76.0)),
-            "numerical_total": float(RUBRIC.get("numerical", {}).get("total", 24.0)),
-            "total": float(RUBRIC.get("metadata", {}).get("total_max_points", 100.0)),
+            "boolean_total": _BOOLEAN_TOTAL,
+            "numerical_total": _NUMERICAL_TOTAL,
+            "total": _TOTAL_MAX,
         },
     }
@@ -2,11 +2,60 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import os
+import pickle
+import warnings
 
 from Auto_benchmark.io import fs
+from Auto_benchmark.io.cache import BoundedCache
 from Auto_benchmark.Config import defaults
 
+# ---------- Report lookup ----------
+# Keyed by the directory mtimes as well, so adding/removing a report is noticed.
+# Only name-based outcomes are memoized: growing an existing .md leaves the
+# directory mtimes alone, so the largest-file fallback is always recomputed.
+_REPORT_CACHE = BoundedCache(256)
+_NOT_CACHED = object()  # cache-miss marker (None is a valid "no report" result)
+
+def _dir_mtime_ns(d: Path) -> Optional[int]:
+    try:
+        return d.stat().st_mtime_ns
+    except OSError:
+        return None
+
+def _md_entries(d: Path) -> List[os.DirEntry]:
+    """*.md entries of one directory, sorted by name (DirEntry caches its stat)."""
+    try:
+        with os.scandir(d) as it:
+            return sorted((e for e in it if e.name.endswith(".md")), key=lambda e: e.name)
+    except OSError:
+        return []
+
+def _find_report_in(root: Path, rep_dir: Path) -> Tuple[Optional[Path], bool]:
+    """
+    Uncached report lookup behind `BenchmarkJob.find_report`.
+
+    Returns (report, cacheable); cacheable is False when the pick came from
+    the size-based fallback, which file edits can change.
+    """
+    candidates = _md_entries(root)
+    if rep_dir.is_dir():
+        candidates += _md_entries(rep_dir)
+
+    if not candidates:
+        return None, True
+
+    by_name = {e.name: e for e in candidates}
+    for name in defaults.REPORT_FILENAMES:
+        if name in by_name:
+            return Path(by_name[name].path), True
+
+    # Fallback: Largest file
+    return Path(max(candidates, key=lambda e: e.stat().st_size).path), False
+
 class BenchmarkJob(ABC):
     """
     Abstract Base Class for all benchmark jobs.
@@ -43,21 +92,15 @@ class BenchmarkJob(ABC):
         Returns:
             Optional[Path]: Path to the report file, or None if not found.
         """
-        candidates = sorted(self.root.glob("*.md"))
         rep_dir = self.root / defaults.REPORT_DIR_NAME
-        if rep_dir.is_dir():
-            candidates += sorted(rep_dir.glob("*.md"))
-            
-        if not candidates:
-            return None
-            
-        by_name = {p.name: p for p in candidates}
-        for name in defaults.REPORT_FILENAMES:
-            if name in by_name:
-                return by_name[name]
-        
-        # Fallback: Largest file
-        return max(candidates, key=lambda p: p.stat().st_size)
+        key = (str(self.root), _dir_mtime_ns(self.root), _dir_mtime_ns(rep_dir))
+        found = _REPORT_CACHE.get(key, _NOT_CACHED)
+        if found is not _NOT_CACHED:
+            return found
+        found, cacheable = _find_report_in(self.root, rep_dir)
+        if cacheable:
+            _REPORT_CACHE.put(key, found)
+        return found
 
     def scan_folders(self) -> List[Path]:
         """
@@ -69,53 +112,14 @@ class BenchmarkJob(ABC):
         """
         return fs.select_unique_by_inchikey(self.root, prefer_real_freqs=True)
 
-    @abstractmethod
-    def check_inputs(self, context: Any) -> Dict[str, Any]:
-        """
-        Step 1: Perform input validity checks.
-        
-        Args:
-            context (Any): Job-specific context (e.g., file mapping).
-            
-        Returns:
-            Dict[str, Any]: Boolean results for input checks.
-        """
-        pass
-    
-    @abstractmethod
-    def check_outputs(self, context: Any) -> Dict[str, Any]:
-        """
-        Step 2: Perform output validity checks.
-        
-        Args:
-            context (Any): Job-specific context (e.g., file mapping).
-            
-        Returns:
-            Dict[str, Any]: Boolean results for output checks.
-        """
-        pass
-    
-    @abstractmethod
-    def calculate_ground_truth(self, context: Any) -> Dict[str, Any]:
-        """
-        Step 3: Calculate ground truth values from the outputs.
-        
-        Args:
-            context (Any): Job-specific context (e.g., file mapping).
-            
-        Returns:
-            Dict[str, Any]: The calculated ground truth data.
-        """
-        pass
-
     @abstractmethod
     def process_folder(self, folder: Path) -> Dict[str, Any]:
         """
         Extract data (Booleans + Ground Truth) from a single folder.
         Combine funtion as the following steps ideally: 
-        1. check_inputs
-        2. check_outputs
-        3. calculate_ground_truth
+        1. input validity checks
+        2. output validity checks
+        3. ground truth calculation
 
         Args:
             folder (Path): The folder to process.
@@ -125,6 +129,45 @@ class BenchmarkJob(ABC):
         """
         pass
 
+    def process_folders(self, folders: List[Path], max_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Run `process_folder` over all folders in parallel, preserving order.
+
+        Folders are independent, so they are fanned out to a process pool.
+        Falls back to threads when the job cannot be pickled (or the pool
+        dies), and runs inline for a single folder or `max_workers=1`.
+
+        Args:
+            folders (List[Path]): Folders to process (already filtered).
+            max_workers (Optional[int]): Pool size (default: os.cpu_count()).
+
+        Returns:
+            List[Dict[str, Any]]: One process_folder() result per folder.
+        """
+        folders = list(folders)
+        workers = min(max_workers or os.cpu_count() or 1, len(folders))
+        if workers <= 1:
+            return [self.process_folder(f) for f in folders]
+
+        chunksize = max(1, min(4, len(folders) // workers))
+        try:
+            pickle.dumps(self)
+        except Exception:
+            pass
+        else:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    return list(pool.map(self.process_folder, folders, chunksize=chunksize))
+            except (BrokenProcessPool, pickle.PicklingError):
+                warnings.warn(
+                    "Process pool unavailable; falling back to threads.",
+                    RuntimeWarning,
+                    stacklevel=2,
+                )
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(self.process_folder, folders))
+
     @abstractmethod
     def extract_agent_data(self, report_path: Optional[Path]) -> Dict[str, Any]:
         """
@@ -152,12 +195,18 @@ class BenchmarkJob(ABC):
         """
         pass
     
-    @abstractmethod
     def run(self) -> Dict[str, Any]:
         """
-        Main execution template method.
+        Main execution template method: scan, process the folders in
+        parallel (`process_folders`), extract the report, score.
         
         Returns:
             Dict[str, Any]: The complete benchmark result.
         """
-        pass
+        folders = self.scan_folders()
+        folder_results = self.process_folders(folders)
+
+        report_path = self.find_report()
+        agent_data = self.extract_agent_data(report_path)
+
+        return self.score_all(folder_results, agent_data)
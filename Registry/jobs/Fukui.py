@@ -1,7 +1,9 @@
 # Auto_benchmark/registry/jobs/Fukui.py
 from __future__ import annotations
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+import os
 
 from Auto_benchmark.registry.base import BenchmarkJob
 from Auto_benchmark.Grading.Rubrics.Fukui import RUBRIC_FUKUI
@@ -16,6 +18,42 @@ from Auto_benchmark.Checks.ORCA import (
     output_fukui as fukui_output_checks
 )
 
+# Calculation roles, in input-check order; output checks list the SP roles Neutral-first.
+_ROLES = ("OPT", "Anion", "Neutral", "Cation")
+_OUTPUT_ROLES = ("OPT", "Neutral", "Anion", "Cation")
+_SP_ROLES = ("Anion", "Neutral", "Cation")
+_KIND_BY_SUFFIX = {".inp": "inp", ".out": "out"}
+
+def _classify_role(name: str) -> Optional[str]:
+    """
+    Role of a lower-cased file name, by token priority (cation > anion >
+    neutral > opt; 'neutral' + 'opt' is the OPT run). Priority, not position,
+    decides, so this stays a short cascade of substring tests.
+    """
+    if "cation" in name: return "Cation"
+    if "anion" in name: return "Anion"
+    if "neutral" in name: return "OPT" if "opt" in name else "Neutral"
+    if "opt" in name: return "OPT"
+    return None
+
+def _scan_files(path: Path) -> Iterator[os.DirEntry]:
+    """
+    Recursively yield file entries under `path`, in the same order as
+    `path.rglob("*")` (each directory's files, then its subdirectories),
+    reusing the type information os.scandir already has.
+    """
+    try:
+        with os.scandir(path) as it:
+            entries = list(it)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.is_file():
+            yield entry
+    for entry in entries:
+        if entry.is_dir(follow_symlinks=False):
+            yield from _scan_files(entry.path)
+
 class FukuiJob(BenchmarkJob):
     """Benchmark job for Fukui Index calculations."""
 
@@ -28,87 +66,93 @@ class FukuiJob(BenchmarkJob):
 
     def _identify_files(self, folder: Path) -> Dict[str, Dict[str, Optional[Path]]]:
         """Helper to map files to roles (OPT, Anion, Neutral, Cation)."""
-        all_files = list(folder.rglob("*"))
-        files_map = {
-            "OPT": {"inp": None, "out": None},
-            "Anion": {"inp": None, "out": None},
-            "Neutral": {"inp": None, "out": None},
-            "Cation": {"inp": None, "out": None},
-        }
+        files_map = {role: {"inp": None, "out": None} for role in _ROLES}
         
-        for f in all_files:
-            if not f.is_file(): continue
-            name = f.name.lower()
-            role = None
-            if "cation" in name: role = "Cation"
-            elif "anion" in name: role = "Anion"
-            elif "neutral" in name: role = "OPT" if "opt" in name else "Neutral"
-            elif "opt" in name: role = "OPT"
-            
+        for entry in _scan_files(folder):
+            name = entry.name.lower()
+            kind = _KIND_BY_SUFFIX.get(name[-4:])
+            if kind is None:
+                continue
+            role = _classify_role(name)
             if role:
-                if name.endswith(".inp"): files_map[role]["inp"] = f
-                elif name.endswith(".out"): files_map[role]["out"] = f
+                files_map[role][kind] = Path(entry.path)
         return files_map
 
+    def _check_one_input(self, role: str, inp_path: Optional[Path]) -> Dict[str, str]:
+        """Input checks for one role (independent of the other roles)."""
+        # Check 1: Input Exists
+        # input_checks.check_input_exists returns bool -> convert to "yes"/"no"
+        exists = input_checks.check_input_exists(inp_path)
+
+        task_match = "no"
+        struct_valid = "no"
+
+        if exists:
+            # Safe to read because exists check passed
+            inp_text = readers.read_text_safe(inp_path)
+            
+            # Check 2: Task Match
+            # Target depends on role: "OPT" for OPT, "SP" for others.
+            target_task = "OPT" if role == "OPT" else "SP"
+            
+            # input_checks.check_orca_task returns bool -> update flag if True
+            if input_checks.check_orca_task(inp_text, target_task):
+                task_match = "yes"
+            
+            # Check 3: Structure Validity
+            # input_checks.verify_structure returns "yes"/"no" string directly
+            struct_valid = input_checks.verify_structure(inp_text, inp_path.parent)
+
+        return {
+            f"{role}_input_exist?": "yes" if exists else "no",
+            f"{role}_task_match?": task_match,
+            f"{role}_structure_valid?": struct_valid,
+        }
+
     def check_inputs(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Step 1: input validity checks for every role (context: the files map)."""
         files_map = context
+        roles = _ROLES
         bools = {}
-        for role in ["OPT", "Anion", "Neutral", "Cation"]:
-            inp_path = files_map[role]["inp"]
-            
-            # Check 1: Input Exists
-            # input_checks.check_input_exists returns bool -> convert to "yes"/"no"
-            exists = input_checks.check_input_exists(inp_path)
-            bools[f"{role}_input_exist?"] = "yes" if exists else "no"
-
-            task_match = "no"
-            struct_valid = "no"
-
-            if exists:
-                # Safe to read because exists check passed
-                inp_text = readers.read_text_safe(inp_path)
-                
-                # Check 2: Task Match
-                # Target depends on role: "OPT" for OPT, "SP" for others.
-                target_task = "OPT" if role == "OPT" else "SP"
-                
-                # input_checks.check_orca_task returns bool -> update flag if True
-                if input_checks.check_orca_task(inp_text, target_task):
-                    task_match = "yes"
-                
-                # Check 3: Structure Validity
-                # input_checks.verify_structure returns "yes"/"no" string directly
-                struct_valid = input_checks.verify_structure(inp_text, inp_path.parent)
-
-            bools[f"{role}_task_match?"] = task_match
-            bools[f"{role}_structure_valid?"] = struct_valid
+        # Roles are independent files: overlap their reads (map keeps role order).
+        with ThreadPoolExecutor(max_workers=len(roles)) as pool:
+            for part in pool.map(lambda r: self._check_one_input(r, files_map[r]["inp"]), roles):
+                bools.update(part)
         return bools
 
+    def _check_one_output(self, role: str, p: Optional[Path]) -> Dict[str, str]:
+        """Output checks for one role: OPT gets convergence/frequency checks, SPs population analyses."""
+        if role == "OPT":
+            opt_txt = readers.read_text_safe(p) if p else ""
+            return {
+                "OPT_SCF_converged?": "yes" if output_checks.scf_converged(opt_txt) else "no",
+                "OPT_geo_opt_converged?": "yes" if opt_output_checks.geo_opt_converged(opt_txt) else "no",
+                "OPT_imag_freq_not_exist?": "yes" if opt_output_checks.imaginary_freq_not_exist(opt_txt) else "no",
+            }
+
+        txt = readers.read_text_cached(p) if p else ""  # re-used by calculate_ground_truth
+        return {
+            f"{role}_SCF_converged?": "yes" if output_checks.scf_converged(txt) else "no",
+            f"{role}_Mulliken_exist?": "yes" if fukui_output_checks.mulliken_exist(txt) else "no",
+            f"{role}_Hirshfeld_exist?": "yes" if fukui_output_checks.hirshfeld_exist(txt) else "no",
+            f"{role}_Loewdin_exist?": "yes" if fukui_output_checks.loewdin_exist(txt) else "no",
+        }
+
     def check_outputs(self, context: Dict[str, Any]) -> Dict[str, str]:
+        """Step 2: output validity checks for every role (context: the files map)."""
         files_map = context
+        # 1. OPT Output Checks, 2. SP Output Checks (Neutral, Anion, Cation)
+        roles = _OUTPUT_ROLES
         bools = {}
-        
-        # 1. OPT Output Checks
-        opt_out = files_map["OPT"]["out"]
-        opt_txt = readers.read_text_safe(opt_out) if opt_out else ""
-        bools["OPT_SCF_converged?"] = "yes" if output_checks.scf_converged(opt_txt) else "no"
-        bools["OPT_geo_opt_converged?"] = "yes" if opt_output_checks.geo_opt_converged(opt_txt) else "no"
-        bools["OPT_imag_freq_not_exist?"] = "yes" if opt_output_checks.imaginary_freq_not_exist(opt_txt) else "no"
-
-        # 2. SP Output Checks (Neutral, Anion, Cation)
-        for role in ["Neutral", "Anion", "Cation"]:
-            p = files_map[role]["out"]
-            txt = readers.read_text_safe(p) if p else ""
-            bools[f"{role}_SCF_converged?"] = "yes" if output_checks.scf_converged(txt) else "no"
-            bools[f"{role}_Mulliken_exist?"] = "yes" if fukui_output_checks.mulliken_exist(txt) else "no"
-            bools[f"{role}_Hirshfeld_exist?"] = "yes" if fukui_output_checks.hirshfeld_exist(txt) else "no"
-            bools[f"{role}_Loewdin_exist?"] = "yes" if fukui_output_checks.loewdin_exist(txt) else "no"
-            
+        with ThreadPoolExecutor(max_workers=len(roles)) as pool:
+            for part in pool.map(lambda r: self._check_one_output(r, files_map[r]["out"]), roles):
+                bools.update(part)
         return bools
 
     def calculate_ground_truth(self, context: Dict[str, Any]) -> Dict[str, Any]:
+        """Step 3: Fukui indices from the Anion/Neutral/Cation outputs (context: the files map)."""
         files_map = context
-        outs = [files_map[r]["out"] for r in ["Anion", "Neutral", "Cation"] if files_map[r]["out"]]
+        outs = [files_map[r]["out"] for r in _SP_ROLES if files_map[r]["out"]]
         return calculate_fukui_indices(outs)
 
     def process_folder(self, folder: Path) -> Dict[str, Any]:
@@ -118,10 +162,14 @@ class FukuiJob(BenchmarkJob):
         # 1. Identify files
         files_map = self._identify_files(folder)
 
-        # 2. Run separated checks
-        inputs_res = self.check_inputs(files_map)
-        outputs_res = self.check_outputs(files_map)
-        gt_res = self.calculate_ground_truth(files_map)
+        # 2. Run separated checks. Inputs share no files with the outputs, so
+        # they run alongside; ground truth follows check_outputs so it reuses
+        # the output texts that step cached instead of reading them again.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            fut_inputs = pool.submit(self.check_inputs, files_map)
+            outputs_res = self.check_outputs(files_map)
+            gt_res = self.calculate_ground_truth(files_map)
+            inputs_res = fut_inputs.result()
 
         return {
             "Folder": folder.name, 
@@ -146,15 +194,3 @@ class FukuiJob(BenchmarkJob):
             rubric=self.rubric
         )
         return score
-
-    def run(self) -> Dict[str, Any]:
-        folders = self.scan_folders()
-        
-        folder_results = []
-        for folder in folders:
-            folder_results.append(self.process_folder(folder))
-            
-        report_path = self.find_report()
-        agent_data = self.extract_agent_data(report_path)
-        
-        return self.score_all(folder_results, agent_data)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from typing import Dict, Any, List, Optional
 from pathlib import Path
+import numpy as np
 import pandas as pd
 import os
 
@@ -12,6 +13,44 @@ from Auto_benchmark.io import readers, fs
 from Auto_benchmark.Checks.ORCA import input_checks as ic, output_common as oc, output_opt as oopt
 from Auto_benchmark.Config.defaults import HARTREE_TO_KCAL
 
+def _cumulative_strain(d_by_n: Dict[int, float], all_ns: List[int]) -> Dict[int, float]:
+    """
+    Cumulative strain S_n anchored at S_6 = 0:
+      S_n = S_{n-1} + d_n  (n > 6),   S_n = S_{n+1} - d_{n+1}  (n < 6).
+
+    Each direction is one cumulative sum over the contiguous ring sizes; a missing
+    step (d absent, or n not in all_ns) is NaN, which propagates and so ends the
+    chain exactly where the step-by-step walk stops.
+    """
+    S = {6: 0.0}
+    present = set(all_ns)
+    hi, lo = max(all_ns), min(all_ns)
+    for ns, sign, step in ((range(7, hi + 1), 1.0, 0), (range(5, lo - 1, -1), -1.0, 1)):
+        if not ns:
+            continue
+        d = np.array(
+            [d_by_n.get(n + step, np.nan) if n in present else np.nan for n in ns],
+            dtype=np.float64,
+        )
+        # Leading 0.0 reproduces S_6 + d (and keeps 0.0 - 0.0 == +0.0).
+        cum = np.cumsum(np.concatenate(([0.0], sign * d)))[1:]
+        for n, v in zip(ns, cum.tolist()):
+            if v != v:  # NaN: chain broken from here on
+                break
+            S[n] = v
+    return S
+
+def _resolved_key(folder: Path, known: Dict[str, Any]) -> str:
+    """
+    `os.path.normpath(str(folder.resolve()))`, skipping the per-component
+    resolve when the lexical absolute path is already one of the `known`
+    resolved keys (a resolved path has no symlinks, so it resolves to itself).
+    """
+    lexical = os.path.abspath(folder)
+    if lexical in known and ".." not in Path(folder).parts:
+        return lexical
+    return os.path.normpath(str(Path(folder).resolve()))
+
 class RingStrainJob(BenchmarkJob):
     """Benchmark job for Ring Strain calculations."""
 
@@ -36,14 +75,11 @@ class RingStrainJob(BenchmarkJob):
         """
         inps = list(folder.glob("*.inp"))
         outp = fs.find_best_out_for_qc(folder)
-        itexts = [readers.read_text_safe(p) for p in inps]
-        otext = readers.read_text_safe(outp) if outp else ""
-
-        meth = all(ic.method_exist(t) for t in itexts) if itexts else False
-        base = all(ic.basis_exist(t) for t in itexts) if itexts else False
-        task = all(ic.tasks_exist(t) for t in itexts) if itexts else False
-        chmu = all(ic.charge_mult_exist(t) for t in itexts) if itexts else False
-        xyz  = all(ic.xyz_exist(t) for t in itexts) if itexts else False
+        itexts = readers.read_many(inps)
+        otext = readers.read_text_cached(outp) if outp else ""  # ranked (and cached) just above
+
+        inp = ic.scan_inputs(itexts)  # one scan per input; all False when there are none
+        meth, base, task, chmu, xyz = inp.method, inp.basis, inp.tasks, inp.charge_mult, inp.xyz
         scf = oc.scf_converged(otext) if otext else False
         geo = oopt.geo_opt_converged(otext) if otext else False
         imag = (not oopt.imaginary_freq_not_exist(otext)) if otext else False
@@ -109,7 +145,7 @@ class RingStrainJob(BenchmarkJob):
         
         for d in (cyclo, methyl):
             for rec in d.values():
-                p = os.path.normpath(str(rec["folder"].resolve()))
+                p = _resolved_key(rec["folder"], gt_by_path)
                 if p in gt_by_path:
                     rec["H_au"], rec["G_au"] = gt_by_path[p]
 
@@ -130,21 +166,8 @@ class RingStrainJob(BenchmarkJob):
 
         # 4. Cumulative Strain S_n (Anchored at n=6)
         all_ns = sorted(set(candidate_ns) | {3,4,5,6,7,8})
-        S_H = {6: 0.0}; S_G = {6: 0.0}
-        
-        for n in [k for k in all_ns if k > 6]:
-            prev = n - 1
-            if prev in S_H and n in dH_by_n: 
-                S_H[n] = S_H[prev] + dH_by_n[n]
-            if prev in S_G and n in dG_by_n: 
-                S_G[n] = S_G[prev] + dG_by_n[n]
-            
-        for n in sorted([k for k in all_ns if k < 6], reverse=True):
-            nxt = n + 1
-            if nxt in S_H and nxt in dH_by_n: 
-                S_H[n] = S_H[nxt] - dH_by_n[nxt]
-            if nxt in S_G and nxt in dG_by_n: 
-                S_G[n] = S_G[nxt] - dG_by_n[nxt]
+        S_H = _cumulative_strain(dH_by_n, all_ns)
+        S_G = _cumulative_strain(dG_by_n, all_ns)
 
         # 5. Final GT Rows for Scorer
         final_gt = {}
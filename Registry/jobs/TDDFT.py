@@ -55,28 +55,24 @@ class TDDFTJob(BenchmarkJob):
         inps = list(folder.glob("*.inp"))
         primary_out = fs.find_best_out_for_qc(folder)
         
-        itexts = [readers.read_text_safe(p) for p in inps]
-        otext = readers.read_text_safe(primary_out) if primary_out else ""
+        itexts = readers.read_many(inps)
+        otext = readers.read_text_cached(primary_out) if primary_out else ""  # ranked (and cached) just above
 
         # Booleans
-        meth = all(ic.method_exist(t) for t in itexts) if itexts else False
-        base = all(ic.basis_exist(t) for t in itexts) if itexts else False
-        task = all(ic.tasks_exist(t) for t in itexts) if itexts else False
-        chmu = all(ic.charge_mult_exist(t) for t in itexts) if itexts else False
-        xyz  = all(ic.xyz_exist(t) for t in itexts) if itexts else False
+        inp = ic.scan_inputs(itexts)  # one scan per input; all False when there are none
+        meth, base, task, chmu, xyz = inp.method, inp.basis, inp.tasks, inp.charge_mult, inp.xyz
         
         # New V2 Check (Structure Validity) - Optional addition for robustness
         # struct_valid = all(ic2.verify_structure(t, folder) == "yes" for t in itexts) if itexts else False
 
-        scf = oc.scf_converged(otext) if otext else False
-        geo = oopt.geo_opt_converged(otext) if otext else False
-        imag_exists = False
+        scf = geo = imag_exists = False
+        tddft_b = tddft_e = tddft_f = False
         if otext:
+            scf = oc.scf_converged(otext)
+            geo = oopt.geo_opt_converged(otext)
             imag_exists = not oopt.imaginary_freq_not_exist(otext)
-
-        tddft_b = otd.tddft_block_executed(otext) if otext else False
-        tddft_e = otd.excitation_energy_exist(otext) if otext else False
-        tddft_f = otd.oscillator_strengths_available(otext) if otext else False
+            td = otd.scan_output_tddft(otext)
+            tddft_b, tddft_e, tddft_f = td.block_executed, td.excitation_energy, td.oscillator_strengths
 
         bools = {
             "Method exist?": "yes" if meth else "no",
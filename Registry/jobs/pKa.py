@@ -78,15 +78,12 @@ class PKaJob(BenchmarkJob):
         """
         inps = list(folder.glob("*.inp"))
         outp = fs.find_best_out_for_qc(folder)
-        itexts = [readers.read_text_safe(p) for p in inps]
-        otext = readers.read_text_safe(outp) if outp else ""
+        itexts = readers.read_many(inps)
+        otext = readers.read_text_cached(outp) if outp else ""  # ranked (and cached) just above
 
         # Booleans
-        meth = all(ic.method_exist(t) for t in itexts) if itexts else False
-        base = all(ic.basis_exist(t) for t in itexts) if itexts else False
-        task = all(ic.tasks_exist(t) for t in itexts) if itexts else False
-        chmu = all(ic.charge_mult_exist(t) for t in itexts) if itexts else False
-        xyz  = all(ic.xyz_exist(t) for t in itexts) if itexts else False
+        inp = ic.scan_inputs(itexts)  # one scan per input; all False when there are none
+        meth, base, task, chmu, xyz = inp.method, inp.basis, inp.tasks, inp.charge_mult, inp.xyz
         
         scf = oc.scf_converged(otext) if otext else False
         geo = oopt.geo_opt_converged(otext) if otext else False
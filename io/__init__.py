@@ -7,11 +7,13 @@ Generalized I/O and filesystem utilities shared across modules.
 Exports:
     - fs: structure and file utilities (RDKit-based)
     - readers: safe file reading utilities
+    - cache: bounded, thread-safe memo shared by the module-level caches
 """
 
 from __future__ import annotations
 
 # Public submodules
+from . import cache
 from . import fs
 from . import readers
 
@@ -33,6 +35,7 @@ from .readers import read_text_safe
 
 __all__ = [
     # Submodules
+    "cache",
     "fs",
     "readers",
     # fs helpers
@@ -0,0 +1,45 @@
+# Auto_benchmark/io/cache.py
+from __future__ import annotations
+from typing import Any, Dict, Hashable
+import threading
+
+__all__ = ["BoundedCache"]
+
+
+class BoundedCache:
+    """
+    Small in-process memo: a dict bounded to `maxsize` entries with FIFO
+    eviction (the oldest insertion goes first), safe to share between threads.
+
+    Callers compute values outside the cache; a racing `put` of the same key
+    simply overwrites. Use a private sentinel as `default` when None is a
+    legitimate cached value.
+
+    Args:
+        maxsize (int): Maximum number of entries kept.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value for `key`, or `default` on a miss."""
+        with self._lock:
+            return self._data.get(key, default)
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store `value`, evicting the oldest entry when the cache is full."""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                self._data.pop(next(iter(self._data)))  # evict oldest entry
+            self._data[key] = value
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
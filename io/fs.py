@@ -1,9 +1,16 @@
 # Auto_benchmark/io/fs.py
 from __future__ import annotations
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
+import os
 import re
+import threading
+import numpy as np
+import pandas as pd
 from Auto_benchmark.Config import defaults
+from Auto_benchmark.io import readers
+from Auto_benchmark.io.cache import BoundedCache
 
 # RDKit imports (wrapped to avoid crash if missing, though likely required)
 try:
@@ -15,6 +22,34 @@ except ImportError:
 
 # ---------- Freq / Output Parsing Utilities ----------
 
+# Literal-anchor prefilter for output checks. The checks are case-insensitive
+# regexes over multi-MB outputs; on ASCII text `anchor in text.lower()` is the
+# same test at memchr speed, and the regex only has to run from the first hit.
+# The lowered copy of the most recent text is kept (per thread, so jobs that
+# check several outputs concurrently do not evict each other) so all checks on
+# one output share a single lower() pass.
+_LOWER_LAST = threading.local()
+
+def _ascii_lower(text: str) -> Optional[str]:
+    """`text.lower()` if `text` is ASCII (offsets unchanged), else None."""
+    last, low = getattr(_LOWER_LAST, "pair", (None, None))
+    if last is not text:
+        low = text.lower() if text.isascii() else None
+        _LOWER_LAST.pair = (text, low)
+    return low
+
+def _find_anchor(text: str, anchor: str) -> int:
+    """
+    Position of the first case-insensitive occurrence of a lower-case ASCII anchor.
+
+    Returns -1 when the anchor is certainly absent, and 0 (search everything)
+    when the text is not ASCII and the prefilter cannot be trusted.
+    """
+    low = _ascii_lower(text)
+    if low is None:
+        return 0
+    return low.find(anchor)
+
 def _extract_freqs(txt: str) -> List[float]:
     """
     Extract vibrational frequencies from ORCA output text.
@@ -26,12 +61,13 @@ def _extract_freqs(txt: str) -> List[float]:
     Returns:
         List[float]: A list of extracted frequency values.
     """
-    lines = txt.splitlines()
     block_start = None
-    for i, line in enumerate(lines):
-        if defaults.RE_FREQ_BLOCK.search(line):
-            block_start = i
-            break
+    if _find_anchor(txt, "vibrational") >= 0:
+        lines = txt.splitlines()
+        for i, line in enumerate(lines):
+            if defaults.RE_FREQ_BLOCK.search(line):
+                block_start = i
+                break
     candidates: List[float] = []
     if block_start is not None:
         scan = "\n".join(lines[block_start:block_start + 400])
@@ -76,18 +112,22 @@ def find_best_out_for_qc(folder: Path) -> Optional[Path]:
         return None
 
     def _rank(p: Path):
-        try:
-            txt = p.read_text(errors="ignore")
-        except Exception:
-            return (3, p.name.lower())
+        # Cached read: the job reads the chosen output again right after this.
+        txt = readers.read_text_cached(p)
+        if not txt:
+            try:
+                txt = p.read_text(errors="ignore")  # empty file vs unreadable
+            except Exception:
+                return (3, p.name.lower())
         freqs = _extract_freqs(txt)
         if not freqs:
             return (1, p.name.lower())
         return (0 if all(f >= 0.0 for f in freqs) else 2, p.name.lower())
 
-    best = min(outs, key=_rank)
+    ranks = {p: _rank(p) for p in outs}
+    best = min(outs, key=ranks.__getitem__)
     # If the 'best' isn't perfect (rank 0), check if 'orca.out' exists and use it as fallback anchor
-    if _rank(best)[0] != 0:
+    if ranks[best][0] != 0:
         prim = _read_primary_out(folder)
         return prim if prim else best
     return best
@@ -105,11 +145,7 @@ def folder_has_real_freqs(folder: Path) -> Optional[bool]:
     outp = _read_primary_out(folder)
     if outp is None:
         return None
-    try:
-        txt = outp.read_text(errors="ignore")
-    except Exception:
-        return None
-    freqs = _extract_freqs(txt)
+    freqs = _extract_freqs(readers.read_text_cached(outp))  # "" when unreadable
     if not freqs:
         return None
     return all(f >= 0.0 for f in freqs)
@@ -128,6 +164,188 @@ def has_non_slurm_out(folder: Path) -> bool:
     outs = [p for p in outs if not p.name.lower().startswith(defaults.SKIP_OUTFILE_PREFIXES)]
     return bool(outs)
 
+# ---------- Boolean Table Helpers ----------
+
+_YES = frozenset(defaults.YES_VALUES)
+_NO = frozenset(defaults.NO_VALUES)
+_NULLS = frozenset({"", "none", "null", "n/a", "na", "do not exist"})
+
+@lru_cache(maxsize=256)
+def _norm_str(s: str) -> str:
+    """Strip + lower-case a cell value (cached: tables repeat "yes"/"Yes"/"NO" endlessly)."""
+    return str(s).strip().lower()
+
+def _is_yes(v) -> bool:
+    """True if a table/LLM value means "yes" (bools as-is, otherwise see defaults.YES_VALUES)."""
+    if v is None:
+        return False
+    if isinstance(v, bool):
+        return v
+    return _norm_str(v if isinstance(v, str) else str(v)) in _YES
+
+def _is_no(v) -> bool:
+    """True if a table/LLM value means "no" (bools as-is, otherwise see defaults.NO_VALUES)."""
+    if v is None:
+        return False
+    if isinstance(v, bool):
+        return not v
+    return _norm_str(v if isinstance(v, str) else str(v)) in _NO
+
+def _rel_err(gt, pred) -> Optional[float]:
+    """
+    Relative error |pred - gt| / |gt| between a ground-truth and a predicted value.
+
+    Returns:
+        Optional[float]: None if either value is missing/non-numeric/non-finite
+        or gt == 0 (relative error undefined).
+    """
+    try:
+        g = float(gt)
+        p = float(pred)
+    except (TypeError, ValueError):
+        return None
+    if not (np.isfinite(g) and np.isfinite(p)) or g == 0.0:
+        return None
+    return abs(p - g) / abs(g)
+
+# Parsed boolean CSVs, keyed by (path, mtime_ns, size) so an edited file is re-read.
+_CSV_CACHE = BoundedCache(128)
+
+def read_csv_cached(path: Path) -> pd.DataFrame:
+    """
+    `pd.read_csv` with a per-file memo, for boolean tables scored more than once.
+
+    Args:
+        path (Path): CSV file to read.
+
+    Returns:
+        pd.DataFrame: A shallow copy of the cached frame (column edits do not leak
+        back into the cache; scorers only read it anyway).
+    """
+    st = os.stat(path)
+    key = (str(path), st.st_mtime_ns, st.st_size)
+    df = _CSV_CACHE.get(key)
+    if df is None:
+        df = pd.read_csv(path)
+        _CSV_CACHE.put(key, df)
+    return df.copy(deep=False)
+
+def clear_csv_cache() -> None:
+    """Drop all memoized boolean CSVs."""
+    _CSV_CACHE.clear()
+
+# Column resolution depends only on the table header, and every table of a job
+# shares one header, so resolved names are memoized per (columns, wanted).
+_FIND_COLUMN_CACHE = BoundedCache(4096)
+_MISSING = object()  # cache-miss marker (None is a valid "no such column" result)
+
+def _norm_header(name) -> str:
+    """Header key for matching: lower-cased, all whitespace removed."""
+    return "".join(str(name).split()).lower()
+
+def _find_column(df, name: str) -> Optional[str]:
+    """
+    Resolve one rubric column name against a boolean table's header.
+
+    An exact match wins; otherwise headers are compared case- and
+    whitespace-insensitively (the first match is used).
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        name (str): Column name as written in the rubric.
+
+    Returns:
+        Optional[str]: The table's column label, or None if nothing matches.
+    """
+    if name in df.columns:
+        return name
+    want = _norm_header(name)
+    for col in df.columns:
+        if _norm_header(col) == want:
+            return col
+    return None
+
+def _find_columns(df, wanted: List[str]) -> List[Optional[str]]:
+    """
+    Resolve several rubric column names against one table via `_find_column`.
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        wanted (List[str]): Column names as written in the rubric.
+
+    Returns:
+        List[Optional[str]]: Resolved column names, in the order of `wanted`.
+    """
+    header = tuple(df.columns)
+    resolved: List[Optional[str]] = []
+    for name in wanted:
+        key = (header, name)
+        col = _FIND_COLUMN_CACHE.get(key, _MISSING)
+        if col is _MISSING:
+            col = _find_column(df, name)
+            _FIND_COLUMN_CACHE.put(key, col)
+        resolved.append(col)
+    return resolved
+
+def _is_yes_vec(df, col: Optional[str]) -> np.ndarray:
+    """
+    Column-wise `_is_yes` over a boolean report table.
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        col (Optional[str]): Resolved column name (e.g. from `_find_column`).
+
+    Returns:
+        np.ndarray: Boolean mask with one entry per row; all False if the column is missing.
+    """
+    if col is None or col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df[col].map(_is_yes).to_numpy(dtype=bool)
+
+def _is_no_vec(df, col: Optional[str]) -> np.ndarray:
+    """
+    Column-wise `_is_no` over a boolean report table.
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        col (Optional[str]): Resolved column name (e.g. from `_find_column`).
+
+    Returns:
+        np.ndarray: Boolean mask with one entry per row; all False if the column is missing.
+    """
+    if col is None or col not in df.columns:
+        return np.zeros(len(df), dtype=bool)
+    return df[col].map(_is_no).to_numpy(dtype=bool)
+
+def _yes_matrix(df, cols: List[Optional[str]]) -> np.ndarray:
+    """
+    `_is_yes` over several columns at once.
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        cols (List[Optional[str]]): Resolved column names; missing ones are all 0.
+
+    Returns:
+        np.ndarray: int8 matrix of shape (rows, len(cols)), 1 where the cell is "yes".
+    """
+    mat = np.zeros((len(df), len(cols)), dtype=np.int8)
+    for j, col in enumerate(cols):
+        mat[:, j] = _is_yes_vec(df, col)
+    return mat
+
+def _count_yes(df, cols: List[Optional[str]]) -> np.ndarray:
+    """
+    Per-row number of "yes" values across `cols`.
+
+    Args:
+        df (pd.DataFrame): The boolean table.
+        cols (List[Optional[str]]): Resolved column names; missing ones count as "no".
+
+    Returns:
+        np.ndarray: Integer counts, one per row.
+    """
+    return np.count_nonzero(_yes_matrix(df, cols), axis=1)
+
 # ---------- RDKit / Structure Helpers ----------
 
 def inchikey_from_smiles(smiles: str) -> str:
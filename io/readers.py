@@ -1,5 +1,9 @@
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Iterable, List
+import os
+from Auto_benchmark.io.cache import BoundedCache
 
 def read_text_safe(p: Path) -> str:
     """Read UTF-8 text with errors ignored; return empty string on failure.
@@ -10,4 +14,39 @@ def read_text_safe(p: Path) -> str:
     try:
         return p.read_text(errors="ignore")
     except Exception:
-        return ""
\ No newline at end of file
+        return ""
+
+def read_many(paths: Iterable[Path], max_workers: int = 8) -> List[str]:
+    """`read_text_safe` over several files, overlapping their reads (order kept).
+
+    File reads release the GIL, so a few threads hide per-file latency on
+    network file systems; a single file is read inline.
+    """
+    paths = list(paths)
+    if len(paths) <= 1:
+        return [read_text_safe(p) for p in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as pool:
+        return list(pool.map(read_text_safe, paths))
+
+# Decoded outputs keyed by (path, mtime_ns, size), for files that one job reads
+# several times (output ranking, boolean checks, ground-truth extraction).
+# Outputs can be large, so only a handful are kept.
+_TEXT_CACHE = BoundedCache(8)
+
+def read_text_cached(p: Path) -> str:
+    """`read_text_safe`, decoded once per file version (failures are not cached)."""
+    try:
+        st = os.stat(p)
+    except OSError:
+        return ""
+    key = (str(p), st.st_mtime_ns, st.st_size)
+    text = _TEXT_CACHE.get(key)
+    if text is None:
+        text = read_text_safe(p)
+        if text:
+            _TEXT_CACHE.put(key, text)
+    return text
+
+def clear_text_cache() -> None:
+    """Drop all memoized output texts."""
+    _TEXT_CACHE.clear()